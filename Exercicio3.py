@@ -1,72 +1,70 @@
-class LinkedBinaryTree:
-    class _Node:
-        def __init__(self, element, left=None, right=None):
-            self.element = element
-            self.left = left
-            self.right = right
-
-    def __init__(self):
-        self._root = None
-        self._size = 0
-    
-    # Inserção básica (utilizada nos testes)
-    def add_root(self, e):
-        if self._root is not None:
-            raise ValueError("Raiz já existe")
-        self._root = self._Node(e)
-        self._size = 1
-        return self._root
-    
-    def add_left(self, node, e):
-        if node.left is not None:
-            raise ValueError("Esse nó já tem filho esquerdo")
-        node.left = self._Node(e)
-        self._size += 1
-        return node.left
-    
-    def add_right(self, node, e):
-        if node.right is not None:
-            raise ValueError("Esse nó já tem filho direito")
-        node.right = self._Node(e)
-        self._size += 1
-        return node.right
-
-   
-    #               Traversals – Seção 8.4.4 do PDF
-   
-
-    def preorder(self):
-        """Retorna lista com os elementos visitados em Preorder."""
-        resultado = []
-        self._preorder(self._root, resultado)
-        return resultado
-
-    def _preorder(self, node, lista):
-        if node is not None:
-            lista.append(node.element)            # visita o nó
-            self._preorder(node.left, lista)      # visita subárvore esquerda
-            self._preorder(node.right, lista)     # visita subárvore direita
-
-    def inorder(self):
-        """Retorna lista com os elementos visitados em Inorder."""
-        resultado = []
-        self._inorder(self._root, resultado)
-        return resultado
-
-    def _inorder(self, node, lista):
-        if node is not None:
-            self._inorder(node.left, lista)       # esquerda
-            lista.append(node.element)            # nó
-            self._inorder(node.right, lista)      # direita
-
-    def postorder(self):
-        """Retorna lista com os elementos visitados em Postorder."""
-        resultado = []
-        self._postorder(self._root, resultado)
-        return resultado
-
-    def _postorder(self, node, lista):
-        if node is not None:
-            self._postorder(node.left, lista)     # filho esquerdo
-            self._postorder(node.right, lista)    # filho direito
-            lista.append(node.element)            # visita o nó
+"""Exercício 3: travessias que devolvem a lista de elementos.
+
+A árvore é a de linkedBinaryTree.py. Como na versão original deste
+exercício, ela é montada direto com nós, pelo caminho rápido
+_add_root/_add_left/_add_right, e compact=True usa nós só com elemento
+e filhos.
+"""
+
+from linkedBinaryTree import LinkedBinaryTree
+
+
+#               Traversals – Seção 8.4.4 do PDF
+
+
+def preorder(T):
+    """Retorna lista com os elementos de T visitados em Preorder."""
+    resultado = []
+    _preorder(T._root, resultado)
+    return resultado
+
+
+def _preorder(node, lista):
+    if node is not None:
+        lista.append(node.element)      # visita o nó
+        _preorder(node.left, lista)     # visita subárvore esquerda
+        _preorder(node.right, lista)    # visita subárvore direita
+
+
+def inorder(T):
+    """Retorna lista com os elementos de T visitados em Inorder."""
+    resultado = []
+    _inorder(T._root, resultado)
+    return resultado
+
+
+def _inorder(node, lista):
+    if node is not None:
+        _inorder(node.left, lista)      # esquerda
+        lista.append(node.element)      # nó
+        _inorder(node.right, lista)     # direita
+
+
+def postorder(T):
+    """Retorna lista com os elementos de T visitados em Postorder."""
+    resultado = []
+    _postorder(T._root, resultado)
+    return resultado
+
+
+def _postorder(node, lista):
+    if node is not None:
+        _postorder(node.left, lista)    # filho esquerdo
+        _postorder(node.right, lista)   # filho direito
+        lista.append(node.element)      # visita o nó
+
+
+# ---------------- exemplo rápido de uso ----------------
+if __name__ == "__main__":
+    for compact in (False, True):
+        T = LinkedBinaryTree(compact=compact)
+        T._begin_bulk()
+        r = T._add_root("A")
+        b = T._add_left(r, "B")
+        c = T._add_right(r, "C")
+        T._add_left(b, "D")
+        T._add_left(c, "E")
+        T._add_right(c, "F")
+        T._finish_bulk()
+        print("compact" if compact else "normal ", "| pre:", preorder(T),
+              "| in:", inorder(T), "| pos:", postorder(T))
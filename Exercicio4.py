@@ -1,158 +1,12 @@
-"""LinkedBinaryTree + travessias + verificador de igualdade
-"""
-
-from typing import Any, Optional, Generator
-
+"""Verificador de igualdade, diff e busca de subárvores para LinkedBinaryTree.
 
-class LinkedBinaryTree:
-    """Árvore binária encadeada simples.
+A árvore é a de linkedBinaryTree.py (compact=True também serve: nada aqui
+usa o ponteiro para o pai).
+"""
 
-    Cada nó guarda referência para pai, filho esquerdo e filho direito.
-    A classe fornece uma pequena API baseada na ideia de `Position`.
-    """
+from typing import Any, Dict, List, Optional, Tuple
 
-    class _Node:
-        __slots__ = ("elem", "parent", "left", "right")
-
-        def __init__(self, elem: Any, parent: Optional["LinkedBinaryTree._Node"] = None):
-            self.elem = elem
-            self.parent = parent
-            self.left: Optional["LinkedBinaryTree._Node"] = None
-            self.right: Optional["LinkedBinaryTree._Node"] = None
-
-    class Position:
-        """Objeto leve que expõe um nó (sem permitir acesso direto ao ponteiro)."""
-        def __init__(self, container: "LinkedBinaryTree", node: Optional["_Node"]):
-            self._container = container
-            self._node = node
-
-        def element(self) -> Any:
-            return self._node.elem
-
-        def __eq__(self, other: object) -> bool:
-            return type(other) is type(self) and other._node is self._node
-
-        def __bool__(self) -> bool:
-            return self._node is not None
-
-    # ---------------- construtor e utilitários ----------------
-    def __init__(self):
-        self._root: Optional[LinkedBinaryTree._Node] = None
-        self._size = 0
-
-    def __len__(self) -> int:
-        return self._size
-
-    def _validate(self, p: "LinkedBinaryTree.Position") -> "_Node":
-        if not isinstance(p, LinkedBinaryTree.Position):
-            raise TypeError("p deve ser uma Position")
-        if p._container is not self:
-            raise ValueError("Position não pertence a esta árvore")
-        if p._node is None:
-            raise ValueError("Position inválida (node é None)")
-        return p._node
-
-    def _make_position(self, node: Optional["_Node"]) -> Optional["LinkedBinaryTree.Position"]:
-        return LinkedBinaryTree.Position(self, node) if node is not None else None
-
-    # ---------------- acessores básicos ----------------
-    def root(self) -> Optional["LinkedBinaryTree.Position"]:
-        return self._make_position(self._root)
-
-    def parent(self, p: "LinkedBinaryTree.Position") -> Optional["LinkedBinaryTree.Position"]:
-        node = self._validate(p)
-        return self._make_position(node.parent)
-
-    def left(self, p: "LinkedBinaryTree.Position") -> Optional["LinkedBinaryTree.Position"]:
-        node = self._validate(p)
-        return self._make_position(node.left)
-
-    def right(self, p: "LinkedBinaryTree.Position") -> Optional["LinkedBinaryTree.Position"]:
-        node = self._validate(p)
-        return self._make_position(node.right)
-
-    def is_root(self, p: "LinkedBinaryTree.Position") -> bool:
-        return self.root() == p
-
-    def is_leaf(self, p: "LinkedBinaryTree.Position") -> bool:
-        node = self._validate(p)
-        return node.left is None and node.right is None
-
-    def is_empty(self) -> bool:
-        return self._size == 0
-
-    # ---------------- modificadores (simples) ----------------
-    def add_root(self, e: Any) -> "LinkedBinaryTree.Position":
-        """Cria a raiz se não existir (erro se já existir)."""
-        if self._root is not None:
-            raise ValueError("Raiz já existe")
-        self._root = LinkedBinaryTree._Node(e)
-        self._size = 1
-        return self._make_position(self._root)  # type: ignore
-
-    def add_left(self, p: "LinkedBinaryTree.Position", e: Any) -> "LinkedBinaryTree.Position":
-        node = self._validate(p)
-        if node.left is not None:
-            raise ValueError("Filho esquerdo já existe")
-        node.left = LinkedBinaryTree._Node(e, parent=node)
-        self._size += 1
-        return self._make_position(node.left)  # type: ignore
-
-    def add_right(self, p: "LinkedBinaryTree.Position", e: Any) -> "LinkedBinaryTree.Position":
-        node = self._validate(p)
-        if node.right is not None:
-            raise ValueError("Filho direito já existe")
-        node.right = LinkedBinaryTree._Node(e, parent=node)
-        self._size += 1
-        return self._make_position(node.right)  # type: ignore
-
-    def replace(self, p: "LinkedBinaryTree.Position", e: Any) -> Any:
-        node = self._validate(p)
-        old = node.elem
-        node.elem = e
-        return old
-
-    # ---------------- travessias implementadas como geradores ----------------
-    def preorder(self) -> Generator["LinkedBinaryTree.Position", None, None]:
-        """Gera posições em pré-ordem (root, left, right)."""
-
-        def _subtree_preorder(n: Optional[LinkedBinaryTree._Node]):
-            if n is None:
-                return
-            yield self._make_position(n)
-            yield from _subtree_preorder(n.left)
-            yield from _subtree_preorder(n.right)
-
-        yield from (pos for pos in _subtree_preorder(self._root) if pos is not None)  
-
-    def inorder(self) -> Generator["LinkedBinaryTree.Position", None, None]:
-        """Gera posições em ordem infixa (left, root, right)."""
-
-        def _subtree_inorder(n: Optional[LinkedBinaryTree._Node]):
-            if n is None:
-                return
-            yield from _subtree_inorder(n.left)
-            yield self._make_position(n)
-            yield from _subtree_inorder(n.right)
-
-        yield from (pos for pos in _subtree_inorder(self._root) if pos is not None)  
-
-    def postorder(self) -> Generator["LinkedBinaryTree.Position", None, None]:
-        """Gera posições em pós-ordem (left, right, root)."""
-
-        def _subtree_postorder(n: Optional[LinkedBinaryTree._Node]):
-            if n is None:
-                return
-            yield from _subtree_postorder(n.left)
-            yield from _subtree_postorder(n.right)
-            yield self._make_position(n)
-
-        yield from (pos for pos in _subtree_postorder(self._root) if pos is not None)  
-
-    # ---------------- utilitários para debug / visão geral ----------------
-    def __str__(self) -> str:
-        """Representação simples: lista infixa de elementos (útil pra debug)."""
-        return "[" + ", ".join(str(p.element()) for p in self.inorder()) + "]"
+from linkedBinaryTree import LinkedBinaryTree
 
 
 # ---------------- função para verificar igualdade de árvores ----------------
@@ -166,13 +20,202 @@ def trees_identical(T1: LinkedBinaryTree, T2: LinkedBinaryTree) -> bool:
         if (n1 is None) ^ (n2 is None):
             return False
         # agora ambos não são None, comparar elemento e recursivamente filhos
-        if n1.elem != n2.elem:
+        if n1.element != n2.element:
             return False
         return _ident(n1.left, n2.left) and _ident(n1.right, n2.right)
 
     return _ident(T1._root, T2._root)
 
 
+# ---------------- diff entre árvores ----------------
+_NAO_HASHAVEL = object()
+
+
+def _ids_estruturais(T: LinkedBinaryTree, tabela: Dict[tuple, int],
+                     sem_hash: Optional[List["LinkedBinaryTree._Node"]] = None) -> Dict["LinkedBinaryTree._Node", int]:
+    """Dá um id canônico para cada subárvore de T (pós-ordem, sem recursão).
+
+    Duas subárvores recebem o mesmo id (usando a mesma tabela) se e só se têm
+    a mesma forma e os mesmos elementos. Elementos não hasheáveis ganham um
+    id único, ou seja, nunca casam com nada (e vão para sem_hash, se dado).
+    """
+    ids: Dict[LinkedBinaryTree._Node, int] = {}
+    if T._root is None:
+        return ids
+    stack: List[Tuple[LinkedBinaryTree._Node, bool]] = [(T._root, False)]
+    while stack:
+        n, filhos_prontos = stack.pop()
+        if not filhos_prontos:
+            stack.append((n, True))
+            if n.right is not None:
+                stack.append((n.right, False))
+            if n.left is not None:
+                stack.append((n.left, False))
+            continue
+        id_esq = ids[n.left] if n.left is not None else 0
+        id_dir = ids[n.right] if n.right is not None else 0
+        chave: tuple = (n.element, id_esq, id_dir)
+        try:
+            hash(chave)
+        except TypeError:
+            chave = (_NAO_HASHAVEL, id(n))
+            if sem_hash is not None:
+                sem_hash.append(n)
+        ids[n] = tabela.setdefault(chave, len(tabela) + 1)
+    return ids
+
+
+def _serializa(n: "LinkedBinaryTree._Node") -> List[Tuple[Any, bool, bool]]:
+    """Subárvore em pré-ordem: (elemento, tem esquerdo?, tem direito?) por nó."""
+    saida = []
+    stack = [n]
+    while stack:
+        n = stack.pop()
+        saida.append((n.element, n.left is not None, n.right is not None))
+        if n.right is not None:
+            stack.append(n.right)
+        if n.left is not None:
+            stack.append(n.left)
+    return saida
+
+
+def tree_diff(T1: LinkedBinaryTree, T2: LinkedBinaryTree) -> List[tuple]:
+    """Lista de operações que transforma T1 em T2 (ver apply_diff).
+
+    Cada operação endereça um nó pelo caminho a partir da raiz ("" é a raiz,
+    "LR" é o filho direito do filho esquerdo):
+
+    - ("replace", caminho, novo_elemento)
+    - ("delete", caminho)                 remove a subárvore inteira
+    - ("insert", caminho, serializacao)   cria uma subárvore onde não havia nó
+
+    Subárvores idênticas são reconhecidas pelo id estrutural e puladas de uma
+    vez, então o custo fica perto de linear quando as árvores diferem pouco.
+    """
+    tabela: Dict[tuple, int] = {}
+    ids1 = _ids_estruturais(T1, tabela)
+    ids2 = _ids_estruturais(T2, tabela)
+
+    ops: List[tuple] = []
+    stack = [(T1._root, T2._root, "")]
+    while stack:
+        a, b, caminho = stack.pop()
+        if a is None and b is None:
+            continue
+        if a is None:
+            ops.append(("insert", caminho, _serializa(b)))
+            continue
+        if b is None:
+            ops.append(("delete", caminho))
+            continue
+        if ids1[a] == ids2[b]:
+            continue  # subárvores idênticas
+        if a.element != b.element:
+            ops.append(("replace", caminho, b.element))
+        stack.append((a.right, b.right, caminho + "R"))
+        stack.append((a.left, b.left, caminho + "L"))
+    return ops
+
+
+def apply_diff(T: LinkedBinaryTree, ops: List[tuple]) -> None:
+    """Aplica em T (no lugar) o script gerado por tree_diff."""
+    for op in ops:
+        tipo, caminho = op[0], op[1]
+        # desce até o pai do nó endereçado
+        pai = None
+        n = T._root
+        for passo in caminho:
+            pai = n
+            n = n.left if passo == "L" else n.right
+        if tipo == "replace":
+            n.element = op[2]
+            T._touch(n)
+        elif tipo == "delete":
+            # o pai já está em mãos, então serve também para árvore compacta
+            T._unlink(n, pai)
+        elif tipo == "insert":
+            # pilha de (nó, lado) esperando filho, na ordem da pré-ordem;
+            # os nós vêm do script, então dá para usar o caminho rápido, em
+            # lote: só a subárvore nova e os ancestrais dela são recalculados
+            pendentes: List[Tuple[Any, str]] = [(pai, caminho[-1:])]
+            raiz = None
+            T._begin_bulk()
+            try:
+                for elem, tem_esq, tem_dir in op[2]:
+                    if not pendentes:
+                        raise ValueError(f"insert em {caminho!r}: nós sobrando na serialização")
+                    dono, lado = pendentes.pop()
+                    if dono is None:
+                        novo = T._add_root(elem)
+                    elif lado == "L":
+                        novo = T._add_left(dono, elem)
+                    else:
+                        novo = T._add_right(dono, elem)
+                    if tem_dir:
+                        pendentes.append((novo, "R"))
+                    if tem_esq:
+                        pendentes.append((novo, "L"))
+                    if raiz is None:
+                        raiz = novo
+                if pendentes:
+                    raise ValueError(f"insert em {caminho!r}: serialização truncada")
+            finally:
+                # mesmo com erro, a árvore sai do modo em lote com tudo em dia
+                T._finish_bulk(raiz)
+        else:
+            raise ValueError(f"operação desconhecida: {tipo!r}")
+
+
+# ---------------- busca de subárvore ----------------
+def _mesma_subarvore(a: "LinkedBinaryTree._Node", b: "LinkedBinaryTree._Node") -> bool:
+    """Mesma comparação de trees_identical, mas a partir de dois nós e sem recursão."""
+    stack = [(a, b)]
+    while stack:
+        n1, n2 = stack.pop()
+        if n1 is None and n2 is None:
+            continue
+        if (n1 is None) ^ (n2 is None) or n1.element != n2.element:
+            return False
+        stack.append((n1.right, n2.right))
+        stack.append((n1.left, n2.left))
+    return True
+
+
+def find_subtree(T1: LinkedBinaryTree, T2: LinkedBinaryTree) -> List["LinkedBinaryTree.Position"]:
+    """Todas as Positions de T1 (em pré-ordem) cuja subárvore é idêntica a T2.
+
+    Usa os mesmos ids estruturais de tree_diff: as duas árvores são
+    numeradas com uma tabela comum e basta comparar o id de cada nó de T1
+    com o id da raiz de T2, em O(n + m). Se T2 tiver elementos não
+    hasheáveis, cai na comparação nó a nó (O(n·m)).
+    """
+    if T2._root is None:
+        return []
+    tabela: Dict[tuple, int] = {}
+    sem_hash: List[LinkedBinaryTree._Node] = []
+    alvo = _ids_estruturais(T2, tabela, sem_hash)[T2._root]
+    if sem_hash:
+        ids1 = None
+    else:
+        ids1 = _ids_estruturais(T1, tabela)
+
+    achados = []
+    stack = [T1._root] if T1._root is not None else []
+    while stack:
+        n = stack.pop()
+        if ids1 is not None:
+            casou = ids1[n] == alvo
+        else:
+            casou = _mesma_subarvore(n, T2._root)
+        if casou:
+            achados.append(T1._make_position(n))
+        if n.right is not None:
+            stack.append(n.right)
+        if n.left is not None:
+            stack.append(n.left)
+    return achados
+
+
 # ---------------- exemplo / teste rápido (estilo estudante) ----------------
 if __name__ == "__main__":
     print("== Teste rápido LinkedBinaryTree ==")
@@ -210,3 +253,18 @@ if __name__ == "__main__":
     r3 = T3.add_root("A")
     T3.add_left(r3, "B")  # diferente (não tem C)
     print("T1 == T3 ?", trees_identical(T1, T3))  # espera False
+
+    # onde T4 = B(D, E) aparece dentro de T2 (antes de mexer em T1)
+    T4 = LinkedBinaryTree()
+    r4 = T4.add_root("B")
+    T4.add_left(r4, "D")
+    T4.add_right(r4, "E")
+    print("\nB(D, E) em T1:", [p.element() for p in find_subtree(T1, T4)])
+    print("B(D, E) em T2:", [p.element() for p in find_subtree(T2, T4)])  # B foi trocado
+
+    # diff: o que muda de T1 para T2 (só B foi alterado)
+    print("\ndiff T1 -> T2:", tree_diff(T1, T2))
+    ops = tree_diff(T1, T3)
+    print("diff T1 -> T3:", ops)
+    apply_diff(T1, ops)
+    print("T1 depois de aplicar o diff == T3 ?", trees_identical(T1, T3), "| tamanho", len(T1))
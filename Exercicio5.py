@@ -1,4 +1,9 @@
-from linkedBinaryTree import LinkedBinaryTree
+from linkedBinaryTree import LinkedBinaryTree, EulerVisitor
+
+try:
+    import numpy as np
+except ImportError:  # só a verificação em lote precisa do numpy
+    np = None
 
 
 def verifica_arvore_soma(arvore):
@@ -37,6 +42,90 @@ def checa_no(no, arvore):
     return True, soma_total
 
 
+class VisitanteArvoreSoma(EulerVisitor):
+    # mesma regra de checa_no, mas para rodar junto de outros cálculos no euler_fold
+    def post(self, p, depth, esq, dir):
+        # folha sempre é válida
+        if esq is None and dir is None:
+            return True, p.element()
+        ok_esq, soma_esq = esq if esq is not None else (True, 0)
+        ok_dir, soma_dir = dir if dir is not None else (True, 0)
+        if not ok_esq or not ok_dir or p.element() != soma_esq + soma_dir:
+            return False, 0
+        return True, p.element() + soma_esq + soma_dir
+
+    def result(self, valor):
+        # árvore vazia é considerada árvore soma
+        return True if valor is None else valor[0]
+
+
+def empacotar_arvores(arvores):
+    # junta várias árvores em arrays planos (cada árvore em pré-ordem, uma após a outra):
+    # valores[i], esq[i], dir[i] (índice global do filho ou -1) e inicio[t] (onde começa a árvore t)
+    # anda direto pelos nós (sem Position nem _validate por nó); nos[i] é o nó do índice i
+    if np is None:
+        raise ImportError("a verificação em lote precisa do numpy")
+    valores, esq, dir, inicio, nos = [], [], [], [0], []
+    for arvore in arvores:
+        if arvore._root is not None:
+            pilha = [(arvore._root, -1, 0)]    # (nó, índice do pai, lado)
+            while pilha:
+                no, pai, lado = pilha.pop()
+                i = len(valores)
+                valores.append(no.element)
+                esq.append(-1)
+                dir.append(-1)
+                nos.append(no)
+                if pai >= 0:
+                    (esq if lado == 0 else dir)[pai] = i
+                if no.right is not None:
+                    pilha.append((no.right, i, 1))
+                if no.left is not None:
+                    pilha.append((no.left, i, 0))
+        inicio.append(len(valores))
+    return (np.asarray(valores), np.asarray(esq, dtype=np.int64),
+            np.asarray(dir, dtype=np.int64), np.asarray(inicio, dtype=np.int64), nos)
+
+
+def verifica_lote_empacotado(valores, esq, dir, inicio, primeira_violacao=False):
+    # mesma regra de checa_no, mas para todos os nós de uma vez:
+    # se a árvore é soma, a soma de uma subárvore é o valor da folha ou 2x o valor do nó interno
+    if np is None:
+        raise ImportError("a verificação em lote precisa do numpy")
+    qtd_arvores = len(inicio) - 1
+    folha = (esq < 0) & (dir < 0)
+    soma = np.where(folha, valores, 2 * valores)
+    soma = np.append(soma, 0)          # índice -1 (sem filho) soma 0
+    violou = ~folha & (valores != soma[esq] + soma[dir])
+
+    arvore_do_no = np.repeat(np.arange(qtd_arvores), np.diff(inicio))
+    ruins = np.bincount(arvore_do_no[violou], minlength=qtd_arvores) > 0
+    mascara = ~ruins
+    if not primeira_violacao:
+        return mascara
+
+    # índice global do primeiro nó que viola (em pré-ordem) em cada árvore, ou -1
+    primeiro = np.full(qtd_arvores, -1, dtype=np.int64)
+    indices = np.flatnonzero(violou)
+    arvores_ruins, onde = np.unique(arvore_do_no[indices], return_index=True)
+    primeiro[arvores_ruins] = indices[onde]
+    return mascara, primeiro
+
+
+def verifica_arvores_soma_lote(arvores, primeira_violacao=False):
+    # verifica_arvore_soma para muitas árvores: devolve um array de bool (uma por árvore)
+    # com primeira_violacao=True devolve também a Position do primeiro nó que falha (ou None)
+    # (arrays já empacotados, como os de Forest.empacotar(), vão direto para verifica_lote_empacotado)
+    arvores = list(arvores)
+    valores, esq, dir, inicio, nos = empacotar_arvores(arvores)
+    if not primeira_violacao:
+        return verifica_lote_empacotado(valores, esq, dir, inicio)
+    mascara, primeiro = verifica_lote_empacotado(valores, esq, dir, inicio, True)
+    # Position só para os nós que falharam (um por árvore, no máximo)
+    return mascara, [arvore._make_position(nos[i]) if i >= 0 else None
+                     for arvore, i in zip(arvores, primeiro)]
+
+
 def exercicio_5():
     print("\n" + "-" * 60)
     print("Exercício 5 - Verificação de Árvore Soma")
@@ -44,31 +133,31 @@ def exercicio_5():
 
     # árvore do exemplo do enunciado
     arvore1 = LinkedBinaryTree()
-    r1 = arvore1._add_root(44)
-    l1 = arvore1._add_left(r1, 9)
-    d1 = arvore1._add_right(r1, 13)
-    arvore1._add_left(l1, 4)
-    arvore1._add_right(l1, 5)
-    arvore1._add_left(d1, 6)
-    arvore1._add_right(d1, 7)
+    r1 = arvore1.add_root(44)
+    l1 = arvore1.add_left(r1, 9)
+    d1 = arvore1.add_right(r1, 13)
+    arvore1.add_left(l1, 4)
+    arvore1.add_right(l1, 5)
+    arvore1.add_left(d1, 6)
+    arvore1.add_right(d1, 7)
 
     # árvore que não satisfaz a condição
     arvore2 = LinkedBinaryTree()
-    r2 = arvore2._add_root(10)
-    l2 = arvore2._add_left(r2, 3)
-    arvore2._add_right(r2, 5)
-    arvore2._add_left(l2, 1)
-    arvore2._add_right(l2, 2)
+    r2 = arvore2.add_root(10)
+    l2 = arvore2.add_left(r2, 3)
+    arvore2.add_right(r2, 5)
+    arvore2.add_left(l2, 1)
+    arvore2.add_right(l2, 2)
 
     # árvore soma simples
     arvore3 = LinkedBinaryTree()
-    r3 = arvore3._add_root(10)
-    arvore3._add_left(r3, 4)
-    arvore3._add_right(r3, 6)
+    r3 = arvore3.add_root(10)
+    arvore3.add_left(r3, 4)
+    arvore3.add_right(r3, 6)
 
     # árvore com apenas um nó
     arvore4 = LinkedBinaryTree()
-    arvore4._add_root(5)
+    arvore4.add_root(5)
 
     # árvore vazia
     arvore5 = LinkedBinaryTree()
@@ -79,6 +168,17 @@ def exercicio_5():
     print("Árvore 4:", verifica_arvore_soma(arvore4))
     print("Árvore 5:", verifica_arvore_soma(arvore5))
 
+    # a mesma verificação via euler_fold (pode rodar junto com outros visitantes)
+    print("\nÁrvore 1 (euler_fold):", arvore1.euler_fold(VisitanteArvoreSoma())[0])
+    print("Árvore 2 (euler_fold):", arvore2.euler_fold(VisitanteArvoreSoma())[0])
+
+    # todas de uma vez, com numpy
+    if np is not None:
+        arvores = [arvore1, arvore2, arvore3, arvore4, arvore5]
+        mascara, falhas = verifica_arvores_soma_lote(arvores, primeira_violacao=True)
+        print("\nEm lote:", mascara.tolist())
+        print("Primeiro nó que falha:", [p.element() if p is not None else None for p in falhas])
+
 
 if __name__ == "__main__":
     exercicio_5()
@@ -1,4 +1,4 @@
-from linkedBinaryTree import LinkedBinaryTree
+from linkedBinaryTree import LinkedBinaryTree, EulerVisitor
 
 
 def imprimir_caminhos(arvore):
@@ -30,6 +30,26 @@ def percorre(no, arvore, caminho_atual):
     caminho_atual.pop()
 
 
+class VisitanteCaminhos(EulerVisitor):
+    # junta os caminhos raiz -> folha em vez de imprimir (para o euler_fold)
+    def __init__(self):
+        self.caminho_atual = []
+        self.caminhos = []
+
+    def pre(self, p, depth):
+        self.caminho_atual.append(p.element())
+
+    def post(self, p, depth, esq, dir):
+        # folha: os dois filhos não existem
+        if esq is None and dir is None:
+            self.caminhos.append(list(self.caminho_atual))
+        self.caminho_atual.pop()
+        return True
+
+    def result(self, valor):
+        return self.caminhos
+
+
 def exercicio_6():
     print("\n" + "-" * 60)
     print("Exercício 6 - Caminhos da raiz até as folhas")
@@ -37,31 +57,31 @@ def exercicio_6():
 
     # árvore do exemplo do enunciado
     arvore1 = LinkedBinaryTree()
-    r = arvore1._add_root(1)
-    n2 = arvore1._add_left(r, 2)
-    n3 = arvore1._add_right(r, 3)
-    arvore1._add_left(n2, 4)
-    arvore1._add_right(n2, 5)
-    n6 = arvore1._add_left(n3, 6)
-    n7 = arvore1._add_right(n3, 7)
-    arvore1._add_left(n6, 8)
-    arvore1._add_right(n7, 9)
+    r = arvore1.add_root(1)
+    n2 = arvore1.add_left(r, 2)
+    n3 = arvore1.add_right(r, 3)
+    arvore1.add_left(n2, 4)
+    arvore1.add_right(n2, 5)
+    n6 = arvore1.add_left(n3, 6)
+    n7 = arvore1.add_right(n3, 7)
+    arvore1.add_left(n6, 8)
+    arvore1.add_right(n7, 9)
 
     print("\nÁrvore 1 - Caminhos:")
     imprimir_caminhos(arvore1)
 
     # árvore simples
     arvore2 = LinkedBinaryTree()
-    r2 = arvore2._add_root(10)
-    arvore2._add_left(r2, 5)
-    arvore2._add_right(r2, 15)
+    r2 = arvore2.add_root(10)
+    arvore2.add_left(r2, 5)
+    arvore2.add_right(r2, 15)
 
     print("\nÁrvore 2 - Caminhos:")
     imprimir_caminhos(arvore2)
 
     # árvore com apenas um nó
     arvore3 = LinkedBinaryTree()
-    arvore3._add_root(42)
+    arvore3.add_root(42)
 
     print("\nÁrvore 3 - Caminhos:")
     imprimir_caminhos(arvore3)
@@ -72,6 +92,8 @@ def exercicio_6():
     print("\nÁrvore 4 - Caminhos:")
     imprimir_caminhos(arvore4)
 
+    print("\nÁrvore 1 - Caminhos (euler_fold):", arvore1.euler_fold(VisitanteCaminhos())[0])
+
 
 if __name__ == "__main__":
     exercicio_6()
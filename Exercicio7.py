@@ -1,4 +1,4 @@
-from linkedBinaryTree import LinkedBinaryTree
+from linkedBinaryTree import LinkedBinaryTree, EulerVisitor
 
 
 def buscar_ancestrais(arvore, valor):
@@ -35,6 +35,25 @@ def procura_no(no, arvore, valor, lista_ancestrais):
     return False
 
 
+class VisitanteAncestrais(EulerVisitor):
+    # ancestrais da primeira ocorrência (em pré-ordem) de valor, do pai até a raiz
+    def __init__(self, valor):
+        self.valor = valor
+        self.caminho = []
+        self.ancestrais = None
+
+    def pre(self, p, depth):
+        if self.ancestrais is None and p.element() == self.valor:
+            self.ancestrais = self.caminho[::-1]
+        self.caminho.append(p.element())
+
+    def post(self, p, depth, esq, dir):
+        self.caminho.pop()
+
+    def result(self, valor):
+        return self.ancestrais if self.ancestrais is not None else []
+
+
 def exercicio_7():
     print("\n" + "-" * 60)
     print("Exercício 7 - Ancestrais de um nó")
@@ -42,15 +61,15 @@ def exercicio_7():
 
     # árvore do exemplo
     arvore1 = LinkedBinaryTree()
-    r = arvore1._add_root(1)
-    n2 = arvore1._add_left(r, 2)
-    n3 = arvore1._add_right(r, 3)
-    arvore1._add_left(n2, 4)
-    n5 = arvore1._add_right(n2, 5)
-    n6 = arvore1._add_left(n3, 6)
-    n7 = arvore1._add_right(n3, 7)
-    arvore1._add_left(n6, 8)
-    arvore1._add_right(n7, 9)
+    r = arvore1.add_root(1)
+    n2 = arvore1.add_left(r, 2)
+    n3 = arvore1.add_right(r, 3)
+    arvore1.add_left(n2, 4)
+    n5 = arvore1.add_right(n2, 5)
+    n6 = arvore1.add_left(n3, 6)
+    n7 = arvore1.add_right(n3, 7)
+    arvore1.add_left(n6, 8)
+    arvore1.add_right(n7, 9)
 
     print("\nÁrvore:")
     print("         1")
@@ -76,12 +95,20 @@ def exercicio_7():
     # nó que não existe
     print(f"Ancestrais do nó 100: {buscar_ancestrais(arvore1, 100)}")
 
+    # várias buscas (e outros cálculos) juntas numa única passada
+    from Exercicio5 import VisitanteArvoreSoma
+    from Exercicio6 import VisitanteCaminhos
+    resultados = arvore1.euler_fold(VisitanteAncestrais(9), VisitanteAncestrais(6),
+                                    VisitanteCaminhos(), VisitanteArvoreSoma())
+    print(f"\nNuma passada só: ancestrais de 9 = {resultados[0]}, de 6 = {resultados[1]},")
+    print(f"caminhos = {resultados[2]}, árvore soma? {resultados[3]}")
+
     # outra árvore para teste
     arvore2 = LinkedBinaryTree()
-    r2 = arvore2._add_root(10)
-    n5_2 = arvore2._add_left(r2, 5)
-    arvore2._add_right(r2, 15)
-    arvore2._add_left(n5_2, 3)
+    r2 = arvore2.add_root(10)
+    n5_2 = arvore2.add_left(r2, 5)
+    arvore2.add_right(r2, 15)
+    arvore2.add_left(n5_2, 3)
 
     print("\nOutra árvore:")
     print("       10")
@@ -58,14 +58,14 @@ def exercicio_8():
 
     # árvore do exemplo
     arvore1 = LinkedBinaryTree()
-    r = arvore1._add_root(1)
-    n2 = arvore1._add_left(r, 2)
-    n3 = arvore1._add_right(r, 3)
-    arvore1._add_right(n2, 4)
-    n5 = arvore1._add_left(n3, 5)
-    arvore1._add_right(n3, 6)
-    arvore1._add_left(n5, 7)
-    arvore1._add_right(n5, 8)
+    r = arvore1.add_root(1)
+    n2 = arvore1.add_left(r, 2)
+    n3 = arvore1.add_right(r, 3)
+    arvore1.add_right(n2, 4)
+    n5 = arvore1.add_left(n3, 5)
+    arvore1.add_right(n3, 6)
+    arvore1.add_left(n5, 7)
+    arvore1.add_right(n5, 8)
 
     print("\nÁrvore original (inorder):")
     imprimir_inorder(arvore1)
@@ -78,9 +78,9 @@ def exercicio_8():
     # segunda árvore
     print("\n" + "-" * 40)
     arvore2 = LinkedBinaryTree()
-    r2 = arvore2._add_root(10)
-    arvore2._add_left(r2, 5)
-    arvore2._add_right(r2, 15)
+    r2 = arvore2.add_root(10)
+    arvore2.add_left(r2, 5)
+    arvore2.add_right(r2, 15)
 
     print("\nÁrvore 2 original (inorder):")
     imprimir_inorder(arvore2)
@@ -93,7 +93,7 @@ def exercicio_8():
     # árvore com um nó
     print("\n" + "-" * 40)
     arvore3 = LinkedBinaryTree()
-    arvore3._add_root(42)
+    arvore3.add_root(42)
 
     print("\nÁrvore 3 original (inorder):")
     imprimir_inorder(arvore3)
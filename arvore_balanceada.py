@@ -0,0 +1,85 @@
+"""Base AVL comum às árvores que arrumam os próprios nós (linkedBinaryTree.py).
+
+IntervalTree (arvore_intervalos.py) e Rope (corda.py) decidem sozinhas
+onde cada nó fica e se mantêm balanceadas com as mesmas rotações de uma
+AVL. Esta classe junta essa parte: religar um nó no lugar de outro, girar
+e subir até a raiz recalculando os campos (com o _refresh de cada uma) e
+girando onde a diferença de alturas passar de 1.
+
+Os modificadores do LinkedBinaryTree (add_*, replace, ...) não valem
+nessas árvores; bloqueado(dica) gera o método que os recusa.
+"""
+
+from typing import Any, Callable, Optional
+
+from linkedBinaryTree import LinkedBinaryTree
+
+
+def bloqueado(dica: str) -> Callable[..., Any]:
+    """Método que recusa a chamada com TypeError ("<Classe> <dica>")."""
+    def metodo(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(f"{type(self).__name__} {dica}")
+    return metodo
+
+
+class ArvoreBalanceada(LinkedBinaryTree):
+    """LinkedBinaryTree com rotações e rebalanceamento AVL."""
+
+    @staticmethod
+    def _h(node: Optional["LinkedBinaryTree._Node"]) -> int:
+        return node.height if node is not None else -1
+
+    def _relink(self, old: "LinkedBinaryTree._Node", new: Optional["LinkedBinaryTree._Node"]) -> None:
+        """Coloca new no lugar de old embaixo do pai de old."""
+        parent = old.parent
+        if new is not None:
+            new.parent = parent
+        if parent is None:
+            self._root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _rotate(self, y: "LinkedBinaryTree._Node") -> None:
+        """Sobe y acima do pai x."""
+        x = y.parent
+        self._relink(x, y)
+        if x.left is y:
+            x.left = y.right
+            if y.right is not None:
+                y.right.parent = x
+            y.right = x
+        else:
+            x.right = y.left
+            if y.left is not None:
+                y.left.parent = x
+            y.left = x
+        x.parent = y
+        self._refresh(x)
+        self._refresh(y)
+
+    def _rebalance(self, node: Optional["LinkedBinaryTree._Node"]) -> None:
+        """Sobe de node até a raiz recalculando os campos e girando onde precisar."""
+        v = self._nova_versao()
+        self._shape += 1
+        while node is not None:
+            self._refresh(node)
+            bal = self._h(node.left) - self._h(node.right)
+            if bal > 1 or bal < -1:
+                c = node.left if bal > 0 else node.right
+                # neto do lado mais alto (empate: mesmo lado, rotação simples)
+                if bal > 0:
+                    g = c.left if self._h(c.left) >= self._h(c.right) else c.right
+                else:
+                    g = c.right if self._h(c.right) >= self._h(c.left) else c.left
+                if (c.left is g) == (node.left is c):
+                    self._rotate(c)
+                    node = c
+                else:
+                    self._rotate(g)
+                    self._rotate(g)
+                    node = g
+                node.left.version = node.right.version = v
+            node.version = v
+            node = node.parent
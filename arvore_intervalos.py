@@ -0,0 +1,255 @@
+"""Árvore de intervalos sobre os nós do LinkedBinaryTree (linkedBinaryTree.py).
+
+Os intervalos fechados [lo, hi] ficam numa árvore de busca AVL ordenada por
+lo; cada nó guarda também max_end, o maior hi da sua subárvore, mantido em
+inserções, remoções e rotações (junto com altura e tamanho, que o nó do
+linkedBinaryTree.py já tem). Com isso:
+
+- insert / remove: O(log n)
+- overlaps(a, b): só desce nas subárvores que podem ter resposta
+  (max_end >= a e lo <= b); O(log n) por intervalo devolvido no pior caso,
+  perto de O(log n + k) na prática
+- count_overlaps(a, b): O(log n) sem listar nada, como
+  n - #(lo > b) - #(hi < a), usando o tamanho das subárvores nesta árvore e
+  numa segunda árvore AVL ordenada por hi
+
+A navegação e as travessias são as do LinkedBinaryTree; os modificadores de
+lá (add_*, replace, delete, attach, detach) não valem aqui, porque quem
+decide onde cada nó fica é a ordem dos intervalos.
+"""
+
+from collections import namedtuple
+from typing import Any, Iterator, List, Optional
+
+from arvore_balanceada import ArvoreBalanceada, bloqueado
+from linkedBinaryTree import LinkedBinaryTree
+
+Intervalo = namedtuple("Intervalo", "lo hi valor")
+
+
+class _ArvoreAVL(ArvoreBalanceada):
+    """Árvore de busca AVL com os nós do LinkedBinaryTree (chave em node.chave)."""
+
+    class _Node(LinkedBinaryTree._Node):
+        __slots__ = "chave",
+
+        def __init__(self, element: Any, parent: Optional["LinkedBinaryTree._Node"] = None):
+            super().__init__(element, parent)
+            self.chave: Any = None
+
+    add_root = add_left = add_right = replace = delete = attach = detach = prune = \
+        bloqueado("mantém a ordem sozinha; use insert/remove")
+
+    # ---------------- internos ----------------
+    def _insert(self, chave: Any, e: Any) -> "_Node":
+        parent, node = None, self._root
+        while node is not None:
+            parent = node
+            node = node.left if chave < node.chave else node.right
+        novo = self._new_node(e, parent)
+        novo.chave = chave
+        if parent is None:
+            self._root = novo
+        elif chave < parent.chave:
+            parent.left = novo
+        else:
+            parent.right = novo
+        self._size += 1
+        self._rebalance(novo)
+        return novo
+
+    def _remove(self, node: "_Node") -> None:
+        if node.left is not None and node.right is not None:
+            # o sucessor y (sem filho esquerdo) toma o lugar de node
+            y = node.right
+            while y.left is not None:
+                y = y.left
+            if y.parent is not node:
+                start = y.parent
+                self._relink(y, y.right)
+                y.right = node.right
+                y.right.parent = y
+            else:
+                start = y
+            self._relink(node, y)
+            y.left = node.left
+            y.left.parent = y
+        else:
+            start = node.parent
+            self._relink(node, node.left if node.left is not None else node.right)
+        self._size -= 1
+        self._rebalance(start)
+        node.parent = node      # convenção do linkedBinaryTree.py: nó removido
+        self._release(node)
+
+    def _find(self, chave: Any) -> Optional["_Node"]:
+        node = self._root
+        while node is not None and node.chave != chave:
+            node = node.left if chave < node.chave else node.right
+        return node
+
+    def _conta_ate(self, x: Any, inclusive: bool) -> int:
+        """Quantas chaves têm primeiro componente < x (ou <= x). O(log n)."""
+        total = 0
+        node = self._root
+        while node is not None:
+            k = node.chave[0]
+            if k < x or (inclusive and k == x):
+                total += 1 + (node.left.size if node.left is not None else 0)
+                node = node.right
+            else:
+                node = node.left
+        return total
+
+
+class IntervalTree(_ArvoreAVL):
+    """Intervalos fechados [lo, hi] com consultas de sobreposição."""
+
+    class _Node(_ArvoreAVL._Node):
+        __slots__ = "max_end",
+
+        def __init__(self, element: Any, parent: Optional["LinkedBinaryTree._Node"] = None):
+            super().__init__(element, parent)
+            self.max_end: Any = None
+
+    def __init__(self, intervalos: Any = ()):
+        """Árvore com os (lo, hi) ou (lo, hi, valor) de intervalos."""
+        super().__init__()
+        self._por_fim = _ArvoreAVL()     # mesmas entradas, ordenadas por hi
+        self._seq = 0                    # desempate entre intervalos iguais
+        for it in intervalos:
+            self.insert(*it)
+
+    def clone(self, p: Any = None, shallow_elements: bool = True,
+              memo: Optional[dict] = None) -> "IntervalTree":
+        """Cópia independente (só da árvore inteira: a de hi precisa casar)."""
+        if p is not None:
+            raise TypeError("IntervalTree só copia a árvore inteira")
+        if memo is None:
+            memo = {}       # as duas árvores dividem as entradas: um memo só
+        other = super().clone(shallow_elements=shallow_elements, memo=memo)
+        other._por_fim = self._por_fim.clone(shallow_elements=shallow_elements, memo=memo)
+        other._seq = self._seq
+        return other
+
+    def _refresh(self, node: "_Node") -> None:
+        super()._refresh(node)
+        m = node.element.hi
+        if node.left is not None and node.left.max_end > m:
+            m = node.left.max_end
+        if node.right is not None and node.right.max_end > m:
+            m = node.right.max_end
+        node.max_end = m
+
+    # ---------------- modificadores ----------------
+    def insert(self, lo: Any, hi: Any, valor: Any = None) -> "LinkedBinaryTree.Position":
+        """Guarda [lo, hi] (com um valor associado, se dado) e devolve a Position."""
+        if hi < lo:
+            raise ValueError(f"intervalo inválido: [{lo!r}, {hi!r}]")
+        seq = self._seq
+        self._seq += 1
+        self._por_fim._insert((hi, lo, seq), None)
+        return self._make_position(self._insert((lo, hi, seq), Intervalo(lo, hi, valor)))  # type: ignore
+
+    def remove(self, p: "LinkedBinaryTree.Position") -> Intervalo:
+        """Tira o intervalo de p da árvore e o devolve."""
+        node = self._validate(p)
+        lo, hi, seq = node.chave
+        e = node.element
+        self._por_fim._remove(self._por_fim._find((hi, lo, seq)))
+        self._remove(node)
+        return e
+
+    def find(self, lo: Any, hi: Any) -> Optional["LinkedBinaryTree.Position"]:
+        """Position de um intervalo exatamente igual a [lo, hi] (ou None)."""
+        node, achado = self._root, None
+        while node is not None:
+            k = node.chave
+            if (k[0], k[1]) < (lo, hi):
+                node = node.right
+            else:
+                if k[0] == lo and k[1] == hi:
+                    achado = node
+                node = node.left
+        return self._make_position(achado)
+
+    # ---------------- consultas ----------------
+    def _check(self, a: Any, b: Any) -> None:
+        if b < a:
+            raise ValueError(f"consulta inválida: [{a!r}, {b!r}]")
+
+    def iter_overlaps(self, a: Any, b: Any) -> Iterator[Intervalo]:
+        """Intervalos que cruzam [a, b] (lo <= b e hi >= a), em ordem de lo."""
+        self._check(a, b)
+        node = self._root
+        stack: List[Any] = []
+        # inorder iterativo que corta subárvores sem resposta
+        while stack or node is not None:
+            while node is not None and node.max_end >= a:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            e = node.element
+            if e.lo > b:
+                return       # daqui para a frente todo lo é maior que b
+            if e.hi >= a:
+                yield e
+            node = node.right
+
+    def overlaps(self, a: Any, b: Any) -> List[Intervalo]:
+        """Lista com todos os intervalos que cruzam [a, b]."""
+        return list(self.iter_overlaps(a, b))
+
+    def stabbing(self, x: Any) -> List[Intervalo]:
+        """Intervalos que contêm o ponto x."""
+        return self.overlaps(x, x)
+
+    def count_overlaps(self, a: Any, b: Any) -> int:
+        """Quantos intervalos cruzam [a, b], sem listá-los. O(log n)."""
+        self._check(a, b)
+        # todo intervalo com hi < a também tem lo < a <= b, então:
+        # #(lo <= b) - #(hi < a) = n - #(lo > b) - #(hi < a)
+        return self._conta_ate(b, inclusive=True) - self._por_fim._conta_ate(a, inclusive=False)
+
+    def __iter__(self) -> Iterator[Intervalo]:
+        """Intervalos em ordem de lo."""
+        for p in self.inorder():
+            yield p.element()
+
+
+# ---------------- exemplo rápido de uso ----------------
+if __name__ == "__main__":
+    import random
+    import time
+
+    reunioes = IntervalTree([(9, 10, "daily"), (13, 15, "revisão"), (9, 12, "planejamento"),
+                             (16, 17, "1:1"), (11, 14, "almoço longo")])
+    print("em ordem:", [(i.lo, i.hi) for i in reunioes])
+    print("cruzam [10, 11]:", [i.valor for i in reunioes.overlaps(10, 11)])
+    print("quantas cruzam [12, 16]:", reunioes.count_overlaps(12, 16))
+    print("contêm 14:", [i.valor for i in reunioes.stabbing(14)])
+    reunioes.remove(reunioes.find(9, 12))
+    print("sem o planejamento, cruzam [10, 11]:", [i.valor for i in reunioes.overlaps(10, 11)])
+    print("altura:", reunioes.height(), "| nós:", len(reunioes))
+
+    # comparação com a varredura linear por inorder()
+    random.seed(3)
+    n = 50_000
+    T = IntervalTree()
+    for _ in range(n):
+        lo = random.uniform(0, 1_000_000)
+        T.insert(lo, lo + random.expovariate(1 / 50))
+    consultas = [(x, x + 100) for x in (random.uniform(0, 1_000_000) for _ in range(200))]
+    todos = list(T)
+    t0 = time.perf_counter()
+    linear = [sum(1 for i in todos if i.lo <= b and i.hi >= a) for a, b in consultas]
+    t1 = time.perf_counter()
+    arvore = [len(T.overlaps(a, b)) for a, b in consultas]
+    t2 = time.perf_counter()
+    contagem = [T.count_overlaps(a, b) for a, b in consultas]
+    t3 = time.perf_counter()
+    assert linear == arvore == contagem
+    print(f"\n{n} intervalos, {len(consultas)} consultas: varredura {t1 - t0:.3f} s,"
+          f" overlaps {t2 - t1:.4f} s, count_overlaps {t3 - t2:.4f} s (altura {T.height()})")
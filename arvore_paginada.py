@@ -0,0 +1,416 @@
+"""Árvore binária com os nós guardados em disco, em páginas de tamanho fixo.
+
+Mesma API de Position do LinkedBinaryTree (linkedBinaryTree.py), mas cada nó é um
+registro de tamanho fixo num arquivo local:
+
+    pai | esquerdo | direito   (int64, -1 = nenhum)
+    tamanho do elemento (uint32) + elemento em pickle (até elem_size bytes)
+
+Os registros ficam agrupados em páginas; só `cache_pages` páginas ficam em
+memória (LRU), e páginas alteradas são gravadas de volta quando saem do cache
+ou em flush()/close(). As travessias leem adiantado as páginas dos próximos
+nós (juntando páginas vizinhas numa leitura só).
+
+Segurança: os elementos são lidos com pickle.loads direto do arquivo, e
+um pickle pode executar código arbitrário ao ser carregado. Só abra
+arquivos que você mesmo gravou (ou de fonte confiável); nunca um arquivo
+recebido de terceiros.
+"""
+
+import os
+import pickle
+import struct
+from collections import OrderedDict, deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+_HEADER = struct.Struct("<8sqqqqq")  # magic, raiz, tamanho, registros, elem_size, page_records
+_HEADER_BYTES = 64
+_MAGIC = b"PBTREE01"
+_LINKS = struct.Struct("<qqqI")      # pai, esquerdo, direito, tamanho do elemento
+_NONE = -1
+
+
+class PagedBinaryTree:
+    """Árvore binária paginada em arquivo (nós fora da memória)."""
+
+    class Position:
+        """Posição de um nó (guarda só o índice do registro)."""
+        __slots__ = "_container", "_index"
+
+        def __init__(self, container: "PagedBinaryTree", index: int):
+            self._container = container
+            self._index = index
+
+        def element(self) -> Any:
+            return self._container._read_element(self._index)
+
+        def __eq__(self, other: object) -> bool:
+            return (type(other) is type(self) and other._container is self._container
+                    and other._index == self._index)
+
+        def __ne__(self, other: object) -> bool:
+            return not (self == other)
+
+        def __repr__(self) -> str:
+            return f"Position({self.element()!r})"
+
+    # ---------------- construtor / arquivo ----------------
+    def __init__(self, path: str, page_records: int = 256, cache_pages: int = 64,
+                 elem_size: int = 64):
+        """Abre (ou cria) a árvore em path.
+
+        Se o arquivo já existe, page_records e elem_size vêm do cabeçalho.
+        Os elementos são lidos com pickle: abra só arquivos confiáveis.
+        """
+        if cache_pages < 1:
+            raise ValueError("cache_pages deve ser pelo menos 1")
+        self._path = path
+        exists = os.path.exists(path) and os.path.getsize(path) >= _HEADER_BYTES
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if exists:
+            magic, root, size, count, elem_size, page_records = _HEADER.unpack(
+                os.pread(self._fd, _HEADER.size, 0))
+            if magic != _MAGIC:
+                os.close(self._fd)
+                raise ValueError("arquivo não é uma PagedBinaryTree")
+        else:
+            root, size, count = _NONE, 0, 0
+        self._root: int = root
+        self._size: int = size
+        self._count: int = count            # registros já alocados
+        self._elem_size = elem_size
+        self._page_records = page_records
+        self._record_bytes = _LINKS.size + elem_size
+        self._page_bytes = self._record_bytes * page_records
+        self._cache_pages = cache_pages
+        self._cache: "OrderedDict[int, bytearray]" = OrderedDict()
+        self._dirty: set = set()
+        self._stats = {"hits": 0, "misses": 0, "prefetched": 0, "evictions": 0, "writebacks": 0}
+        if not exists:
+            self._write_header()
+
+    def _write_header(self) -> None:
+        data = _HEADER.pack(_MAGIC, self._root, self._size, self._count,
+                            self._elem_size, self._page_records)
+        os.pwrite(self._fd, data.ljust(_HEADER_BYTES, b"\0"), 0)
+
+    def flush(self) -> None:
+        """Grava todas as páginas sujas e o cabeçalho."""
+        for page_no in sorted(self._dirty):
+            self._write_page(page_no, self._cache[page_no])
+        self._dirty.clear()
+        self._write_header()
+
+    def close(self) -> None:
+        if self._fd is not None:
+            self.flush()
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "PagedBinaryTree":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores do cache de páginas (hits, misses, prefetched, evictions, writebacks)."""
+        d = dict(self._stats)
+        d["cached_pages"] = len(self._cache)
+        return d
+
+    # ---------------- cache de páginas ----------------
+    def _page_offset(self, page_no: int) -> int:
+        return _HEADER_BYTES + page_no * self._page_bytes
+
+    def _write_page(self, page_no: int, data: bytearray) -> None:
+        os.pwrite(self._fd, data, self._page_offset(page_no))
+        self._stats["writebacks"] += 1
+
+    def _insert_page(self, page_no: int, data: bytearray) -> None:
+        self._cache[page_no] = data
+        while len(self._cache) > self._cache_pages:
+            old_no, old = self._cache.popitem(last=False)
+            self._stats["evictions"] += 1
+            if old_no in self._dirty:
+                self._dirty.discard(old_no)
+                self._write_page(old_no, old)
+
+    def _read_run(self, first: int, n: int) -> None:
+        """Lê n páginas consecutivas com um único pread e põe no cache."""
+        raw = os.pread(self._fd, n * self._page_bytes, self._page_offset(first))
+        for k in range(n):
+            chunk = raw[k * self._page_bytes:(k + 1) * self._page_bytes]
+            self._insert_page(first + k, bytearray(chunk.ljust(self._page_bytes, b"\0")))
+
+    def _page(self, page_no: int) -> bytearray:
+        data = self._cache.get(page_no)
+        if data is not None:
+            self._cache.move_to_end(page_no)
+            self._stats["hits"] += 1
+            return data
+        self._stats["misses"] += 1
+        self._read_run(page_no, 1)
+        return self._cache[page_no]
+
+    def _prefetch(self, indices: Iterable[int]) -> None:
+        """Traz para o cache as páginas destes registros, agrupando vizinhas."""
+        wanted = sorted({i // self._page_records for i in indices if i != _NONE}
+                        - self._cache.keys())
+        # nunca traz mais do que cabe, para não expulsar o que vai ser usado já
+        wanted = wanted[:max(0, self._cache_pages - 1)]
+        k = 0
+        while k < len(wanted):
+            first = wanted[k]
+            n = 1
+            while k + n < len(wanted) and wanted[k + n] == first + n:
+                n += 1
+            self._read_run(first, n)
+            self._stats["prefetched"] += n
+            k += n
+
+    # ---------------- registros ----------------
+    def _locate(self, index: int):
+        page = self._page(index // self._page_records)
+        return page, (index % self._page_records) * self._record_bytes
+
+    def _read_links(self, index: int):
+        page, off = self._locate(index)
+        return _LINKS.unpack_from(page, off)[:3]
+
+    def _set_link(self, index: int, field: int, value: int) -> None:
+        page, off = self._locate(index)
+        struct.pack_into("<q", page, off + 8 * field, value)
+        self._dirty.add(index // self._page_records)
+
+    def _read_element(self, index: int) -> Any:
+        page, off = self._locate(index)
+        n = _LINKS.unpack_from(page, off)[3]
+        start = off + _LINKS.size
+        # pickle: só é seguro com arquivos confiáveis (ver a descrição do módulo)
+        return pickle.loads(bytes(page[start:start + n]))
+
+    def _write_element(self, index: int, e: Any) -> None:
+        data = pickle.dumps(e, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self._elem_size:
+            raise ValueError(f"elemento ocupa {len(data)} bytes (máximo {self._elem_size})")
+        page, off = self._locate(index)
+        struct.pack_into("<I", page, off + 24, len(data))
+        start = off + _LINKS.size
+        page[start:start + len(data)] = data
+        self._dirty.add(index // self._page_records)
+
+    def _new_record(self, e: Any, parent: int) -> int:
+        index = self._count
+        self._count += 1
+        page, off = self._locate(index)
+        _LINKS.pack_into(page, off, parent, _NONE, _NONE, 0)
+        self._dirty.add(index // self._page_records)
+        self._write_element(index, e)
+        return index
+
+    # ---------------- utilitários internos ----------------
+    def _validate(self, p: "PagedBinaryTree.Position") -> int:
+        if not isinstance(p, PagedBinaryTree.Position):
+            raise TypeError("p deve ser uma Position válida")
+        if p._container is not self:
+            raise ValueError("p não pertence a esta árvore")
+        if self._read_links(p._index)[0] == p._index:   # pai == ele mesmo: removido
+            raise ValueError("p já foi removido")
+        return p._index
+
+    def _make_position(self, index: int) -> Optional["PagedBinaryTree.Position"]:
+        return None if index == _NONE else PagedBinaryTree.Position(self, index)
+
+    # ---------------- informações básicas ----------------
+    def __len__(self) -> int:
+        return self._size
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def root(self) -> Optional["PagedBinaryTree.Position"]:
+        return self._make_position(self._root)
+
+    def parent(self, p: "PagedBinaryTree.Position") -> Optional["PagedBinaryTree.Position"]:
+        return self._make_position(self._read_links(self._validate(p))[0])
+
+    def left(self, p: "PagedBinaryTree.Position") -> Optional["PagedBinaryTree.Position"]:
+        return self._make_position(self._read_links(self._validate(p))[1])
+
+    def right(self, p: "PagedBinaryTree.Position") -> Optional["PagedBinaryTree.Position"]:
+        return self._make_position(self._read_links(self._validate(p))[2])
+
+    def sibling(self, p: "PagedBinaryTree.Position") -> Optional["PagedBinaryTree.Position"]:
+        index = self._validate(p)
+        parent = self._read_links(index)[0]
+        if parent == _NONE:
+            return None
+        _, l, r = self._read_links(parent)
+        return self._make_position(r if l == index else l)
+
+    def num_children(self, p: "PagedBinaryTree.Position") -> int:
+        _, l, r = self._read_links(self._validate(p))
+        return (l != _NONE) + (r != _NONE)
+
+    def children(self, p: "PagedBinaryTree.Position") -> Iterator["PagedBinaryTree.Position"]:
+        _, l, r = self._read_links(self._validate(p))
+        if l != _NONE:
+            yield self._make_position(l)
+        if r != _NONE:
+            yield self._make_position(r)
+
+    def is_leaf(self, p: "PagedBinaryTree.Position") -> bool:
+        return self.num_children(p) == 0
+
+    def is_root(self, p: "PagedBinaryTree.Position") -> bool:
+        return self.root() == p
+
+    # ---------------- modificadores ----------------
+    def add_root(self, e: Any) -> "PagedBinaryTree.Position":
+        if self._root != _NONE:
+            raise ValueError("raiz já existe")
+        self._root = self._new_record(e, _NONE)
+        self._size = 1
+        return self._make_position(self._root)  # type: ignore
+
+    def add_left(self, p: "PagedBinaryTree.Position", e: Any) -> "PagedBinaryTree.Position":
+        index = self._validate(p)
+        if self._read_links(index)[1] != _NONE:
+            raise ValueError("já existe filho esquerdo")
+        child = self._new_record(e, index)
+        self._set_link(index, 1, child)
+        self._size += 1
+        return self._make_position(child)  # type: ignore
+
+    def add_right(self, p: "PagedBinaryTree.Position", e: Any) -> "PagedBinaryTree.Position":
+        index = self._validate(p)
+        if self._read_links(index)[2] != _NONE:
+            raise ValueError("já existe filho direito")
+        child = self._new_record(e, index)
+        self._set_link(index, 2, child)
+        self._size += 1
+        return self._make_position(child)  # type: ignore
+
+    def replace(self, p: "PagedBinaryTree.Position", e: Any) -> Any:
+        index = self._validate(p)
+        old = self._read_element(index)
+        self._write_element(index, e)
+        return old
+
+    def delete(self, p: "PagedBinaryTree.Position") -> Any:
+        """Remove o nó p (no máximo 1 filho). O registro não é reaproveitado."""
+        index = self._validate(p)
+        parent, l, r = self._read_links(index)
+        if l != _NONE and r != _NONE:
+            raise ValueError("não pode remover nó com dois filhos")
+        child = l if l != _NONE else r
+        if child != _NONE:
+            self._set_link(child, 0, parent)
+        if index == self._root:
+            self._root = child
+        else:
+            field = 1 if self._read_links(parent)[1] == index else 2
+            self._set_link(parent, field, child)
+        self._size -= 1
+        elem = self._read_element(index)
+        self._set_link(index, 0, index)   # mesma convenção: pai aponta para si mesmo
+        return elem
+
+    # ---------------- travessias (iterativas, com leitura adiantada) ----------------
+    def preorder(self) -> Iterator["PagedBinaryTree.Position"]:
+        if self.is_empty():
+            return
+        stack: List[int] = [self._root]
+        while stack:
+            index = stack.pop()
+            yield self._make_position(index)  # type: ignore
+            _, l, r = self._read_links(index)
+            if r != _NONE:
+                stack.append(r)
+            if l != _NONE:
+                stack.append(l)
+            self._prefetch(stack[-4:])
+
+    def inorder(self) -> Iterator["PagedBinaryTree.Position"]:
+        stack: List[int] = []
+        index = self._root
+        while stack or index != _NONE:
+            while index != _NONE:
+                stack.append(index)
+                index = self._read_links(index)[1]
+            index = stack.pop()
+            yield self._make_position(index)  # type: ignore
+            index = self._read_links(index)[2]
+            self._prefetch([index] + stack[-2:])
+
+    def postorder(self) -> Iterator["PagedBinaryTree.Position"]:
+        if self.is_empty():
+            return
+        # (índice, filhos já empilhados?)
+        stack = [(self._root, False)]
+        while stack:
+            index, expanded = stack.pop()
+            if expanded:
+                yield self._make_position(index)  # type: ignore
+                continue
+            stack.append((index, True))
+            _, l, r = self._read_links(index)
+            if r != _NONE:
+                stack.append((r, False))
+            if l != _NONE:
+                stack.append((l, False))
+            self._prefetch([l, r])
+
+    def breadthfirst(self) -> Iterator["PagedBinaryTree.Position"]:
+        if self.is_empty():
+            return
+        fringe = deque([self._root])
+        while fringe:
+            index = fringe.popleft()
+            yield self._make_position(index)  # type: ignore
+            _, l, r = self._read_links(index)
+            if l != _NONE:
+                fringe.append(l)
+            if r != _NONE:
+                fringe.append(r)
+            if len(fringe) <= 8:
+                self._prefetch(fringe)
+            else:
+                self._prefetch([fringe[k] for k in range(8)])
+
+    def __iter__(self) -> Iterator[Any]:
+        for p in self.inorder():
+            yield p.element()
+
+    def __str__(self) -> str:
+        if self.is_empty():
+            return "PagedBinaryTree()"
+        return "PagedBinaryTree(inorder: [" + ", ".join(repr(e) for e in self) + "])"
+
+
+# ---------------- exemplo rápido de uso ----------------
+if __name__ == "__main__":
+    import tempfile
+
+    caminho = os.path.join(tempfile.mkdtemp(), "arvore.bin")
+
+    # árvore completa com 20 mil nós, mas só 8 páginas de 128 registros em memória
+    with PagedBinaryTree(caminho, page_records=128, cache_pages=8) as T:
+        fila = deque([T.add_root(0)])
+        i = 1
+        while i < 20_000:
+            p = fila.popleft()
+            fila.append(T.add_left(p, i))
+            fila.append(T.add_right(p, i + 1))
+            i += 2
+        print("nós:", len(T), "| depois de montar:", T.stats())
+
+    # reabre o arquivo e percorre
+    with PagedBinaryTree(caminho, cache_pages=8) as T:
+        soma = sum(p.element() for p in T.breadthfirst())
+        print("soma (BFS):", soma, "|", T.stats())
+        primeiros = [p.element() for _, p in zip(range(8), T.preorder())]
+        print("preorder (início):", primeiros)
+        r = T.root()
+        print("filhos da raiz:", [c.element() for c in T.children(r)])
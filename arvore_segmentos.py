@@ -0,0 +1,175 @@
+"""Árvore de segmentos (segment tree) para soma/mínimo/máximo em intervalos.
+
+Mesma ideia da árvore soma do Exercício 8 (cada nó interno guarda o agregado
+da sua subárvore), mas guardada num array implícito: a raiz é o nó 1 e os
+filhos do nó i são 2i e 2i + 1. Cada nó guarda soma, mínimo e máximo do seu
+segmento; somas em intervalo (range_add) ficam pendentes nos nós (lazy
+propagation) e só descem quando alguém passa por ali.
+
+Intervalos são semiabertos, como em fatias Python: query(lo, hi) cobre
+lo, lo + 1, ..., hi - 1. Todas as operações são O(log n).
+"""
+
+from typing import List, Sequence
+
+
+class SegmentTree:
+    """Segment tree com update pontual, consultas em intervalo e soma em intervalo."""
+
+    def __init__(self, valores: Sequence[float]):
+        self._n = len(valores)
+        tam = 4 * max(1, self._n)
+        self._soma: List[float] = [0] * tam
+        self._min: List[float] = [0] * tam
+        self._max: List[float] = [0] * tam
+        self._lazy: List[float] = [0] * tam   # soma pendente para os filhos
+        if self._n:
+            self._build(1, 0, self._n, valores)
+
+    def __len__(self) -> int:
+        return self._n
+
+    # ---------------- navegação no array implícito ----------------
+    @staticmethod
+    def root() -> int:
+        return 1
+
+    @staticmethod
+    def left(i: int) -> int:
+        return 2 * i
+
+    @staticmethod
+    def right(i: int) -> int:
+        return 2 * i + 1
+
+    @staticmethod
+    def parent(i: int) -> int:
+        return i // 2
+
+    # ---------------- internos ----------------
+    def _build(self, no: int, l: int, r: int, valores: Sequence[float]) -> None:
+        if r - l == 1:
+            self._soma[no] = self._min[no] = self._max[no] = valores[l]
+            return
+        m = (l + r) // 2
+        self._build(2 * no, l, m, valores)
+        self._build(2 * no + 1, m, r, valores)
+        self._pull(no)
+
+    def _pull(self, no: int) -> None:
+        a, b = 2 * no, 2 * no + 1
+        self._soma[no] = self._soma[a] + self._soma[b]
+        self._min[no] = min(self._min[a], self._min[b])
+        self._max[no] = max(self._max[a], self._max[b])
+
+    def _apply(self, no: int, tamanho: int, delta: float) -> None:
+        self._soma[no] += delta * tamanho
+        self._min[no] += delta
+        self._max[no] += delta
+        self._lazy[no] += delta
+
+    def _push(self, no: int, l: int, m: int, r: int) -> None:
+        d = self._lazy[no]
+        if d:
+            self._apply(2 * no, m - l, d)
+            self._apply(2 * no + 1, r - m, d)
+            self._lazy[no] = 0
+
+    def _check(self, lo: int, hi: int) -> None:
+        if not 0 <= lo <= hi <= self._n:
+            raise IndexError(f"intervalo [{lo}, {hi}) fora de [0, {self._n})")
+
+    # ---------------- modificadores ----------------
+    def update(self, i: int, v: float) -> None:
+        """Troca o valor da posição i por v."""
+        if not 0 <= i < self._n:
+            raise IndexError("índice fora do intervalo")
+        no, l, r = 1, 0, self._n
+        caminho = []
+        while r - l > 1:
+            m = (l + r) // 2
+            self._push(no, l, m, r)
+            caminho.append(no)
+            if i < m:
+                no, r = 2 * no, m
+            else:
+                no, l = 2 * no + 1, m
+        self._soma[no] = self._min[no] = self._max[no] = v
+        for no in reversed(caminho):
+            self._pull(no)
+
+    def range_add(self, lo: int, hi: int, delta: float) -> None:
+        """Soma delta a todas as posições de [lo, hi)."""
+        self._check(lo, hi)
+        if lo < hi:
+            self._range_add(1, 0, self._n, lo, hi, delta)
+
+    def _range_add(self, no: int, l: int, r: int, lo: int, hi: int, delta: float) -> None:
+        if lo <= l and r <= hi:
+            self._apply(no, r - l, delta)
+            return
+        m = (l + r) // 2
+        self._push(no, l, m, r)
+        if lo < m:
+            self._range_add(2 * no, l, m, lo, hi, delta)
+        if hi > m:
+            self._range_add(2 * no + 1, m, r, lo, hi, delta)
+        self._pull(no)
+
+    # ---------------- consultas ----------------
+    def _query(self, no: int, l: int, r: int, lo: int, hi: int, arr: List[float], junta, neutro):
+        if lo <= l and r <= hi:
+            return arr[no]
+        m = (l + r) // 2
+        self._push(no, l, m, r)
+        res = neutro
+        if lo < m:
+            res = junta(res, self._query(2 * no, l, m, lo, hi, arr, junta, neutro))
+        if hi > m:
+            res = junta(res, self._query(2 * no + 1, m, r, lo, hi, arr, junta, neutro))
+        return res
+
+    def query(self, lo: int, hi: int) -> float:
+        """Soma de [lo, hi) (0 se o intervalo for vazio)."""
+        self._check(lo, hi)
+        if lo == hi:
+            return 0
+        return self._query(1, 0, self._n, lo, hi, self._soma, lambda a, b: a + b, 0)
+
+    def query_min(self, lo: int, hi: int) -> float:
+        """Mínimo de [lo, hi)."""
+        self._check(lo, hi)
+        if lo == hi:
+            raise ValueError("mínimo de intervalo vazio")
+        return self._query(1, 0, self._n, lo, hi, self._min, min, float("inf"))
+
+    def query_max(self, lo: int, hi: int) -> float:
+        """Máximo de [lo, hi)."""
+        self._check(lo, hi)
+        if lo == hi:
+            raise ValueError("máximo de intervalo vazio")
+        return self._query(1, 0, self._n, lo, hi, self._max, max, float("-inf"))
+
+    def __getitem__(self, i: int) -> float:
+        if not 0 <= i < self._n:
+            raise IndexError("índice fora do intervalo")
+        return self.query(i, i + 1)
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"SegmentTree({list(self)})"
+
+
+# ---------------- exemplo rápido de uso ----------------
+if __name__ == "__main__":
+    st = SegmentTree([5, 2, 8, 1, 9, 3])
+    print(st)
+    print("soma [1, 4):", st.query(1, 4), "| min:", st.query_min(1, 4), "| max:", st.query_max(1, 4))
+    st.update(3, 10)
+    print("depois de update(3, 10):", st)
+    st.range_add(0, 3, 100)
+    print("depois de range_add(0, 3, 100):", st)
+    print("soma total:", st.query(0, len(st)), "| max [2, 6):", st.query_max(2, 6))
@@ -0,0 +1,141 @@
+"""Benchmarks simples (rodar: python benchmarks.py).
+
+Cada função imprime os tempos medidos com time.perf_counter.
+"""
+
+import copy
+import itertools
+import random
+import sys
+import time
+
+from arvore_segmentos import SegmentTree
+from linkedBinaryTree import LinkedBinaryTree
+from memoria import montar_completa
+
+
+def _tempo(f, repeticoes=3):
+    """Melhor tempo (em segundos) de repeticoes chamadas de f."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        f()
+        melhor = min(melhor, time.perf_counter() - t0)
+    return melhor
+
+
+def bench_clone(n=100_000):
+    print(f"\n== clone x deepcopy ({n} nós) ==")
+    T = montar_completa(LinkedBinaryTree(), n)
+
+    t_clone = _tempo(lambda: T.clone())
+    t_clone_deep = _tempo(lambda: T.clone(shallow_elements=False))
+    # deepcopy genérico pelos nós (o que copy.deepcopy fazia antes de __deepcopy__)
+    t_deep = _tempo(lambda: copy.deepcopy(T._root), repeticoes=1)
+    print(f"clone()                        {t_clone * 1000:8.1f} ms")
+    print(f"clone(shallow_elements=False)  {t_clone_deep * 1000:8.1f} ms")
+    print(f"copy.deepcopy dos nós          {t_deep * 1000:8.1f} ms  ({t_deep / t_clone:.1f}x mais lento)")
+
+    # árvore degenerada (uma lista): o deepcopy estoura a pilha, o clone não
+    L = LinkedBinaryTree()
+    p = L.add_root(0)
+    for i in range(1, sys.getrecursionlimit() * 2):
+        p = L.add_left(p, i)
+    try:
+        copy.deepcopy(L._root)
+        print("deepcopy de árvore com altura", L.height(), "ok")
+    except RecursionError:
+        print("deepcopy de árvore com altura", L.height(), "-> RecursionError")
+    print("clone de árvore com altura", L.height(), "->", len(L.clone()), "nós")
+
+
+def bench_segmentos(n=100_000, ops=500):
+    print(f"\n== segment tree x recalcular tudo ({n} valores, {ops} updates + consultas) ==")
+    rng = random.Random(1)
+    valores = [rng.randint(0, 1000) for _ in range(n)]
+    pedidos = []
+    for _ in range(ops):
+        lo = rng.randrange(n)
+        pedidos.append((rng.randrange(n), rng.randint(0, 1000), lo, rng.randint(lo, n)))
+
+    def recalculando():
+        # o agregado inteiro é refeito a cada mudança (como transformar_em_arvore_soma)
+        a = list(valores)
+        total = 0
+        for i, v, lo, hi in pedidos:
+            a[i] = v
+            prefixo = [0, *itertools.accumulate(a)]
+            total += prefixo[hi] - prefixo[lo]
+        return total
+
+    def com_segment_tree():
+        st = SegmentTree(valores)
+        total = 0
+        for i, v, lo, hi in pedidos:
+            st.update(i, v)
+            total += st.query(lo, hi)
+        return total
+
+    assert recalculando() == com_segment_tree()
+    t_rec = _tempo(recalculando, repeticoes=1)
+    t_seg = _tempo(com_segment_tree, repeticoes=1)
+    print(f"recalculando a cada update   {t_rec * 1000:8.1f} ms")
+    print(f"SegmentTree (inclui build)   {t_seg * 1000:8.1f} ms  ({t_rec / t_seg:.1f}x mais rápido)")
+
+
+def bench_caminho_rapido(n=100_000):
+    print(f"\n== add_* com Position x caminho rápido _add_* ({n} nós, árvore completa) ==")
+
+    def rapido(T, lote=False):
+        # mesma árvore de montar_completa: o pai do nó i é o nó (i - 1) // 2
+        if lote:
+            T._begin_bulk()
+        nos = [T._add_root(0)]
+        for i in range(1, n):
+            pai = nos[(i - 1) // 2]
+            nos.append(T._add_left(pai, i) if i % 2 else T._add_right(pai, i))
+        if lote:
+            T._finish_bulk()
+        return T
+
+    a = montar_completa(LinkedBinaryTree(), n)
+    b = rapido(LinkedBinaryTree(), lote=True)
+    assert list(a) == list(b) and a.height() == b.height() and a.subtree_size(a.root()) == len(b)
+
+    t_pos = _tempo(lambda: montar_completa(LinkedBinaryTree(), n))
+    t_rap = _tempo(lambda: rapido(LinkedBinaryTree()))
+    t_lote = _tempo(lambda: rapido(LinkedBinaryTree(), lote=True))
+    t_cmp = _tempo(lambda: rapido(LinkedBinaryTree(compact=True), lote=True))
+    # sem lote, o que sobra em _add_* é quase tudo _fix_upward subindo até a raiz
+    print(f"add_* (Position, conferido)    {t_pos / n * 1e9:8.0f} ns/chamada")
+    print(f"_add_* (nós, sem conferência)  {t_rap / n * 1e9:8.0f} ns/chamada  ({t_pos / t_rap:.1f}x mais rápido)")
+    print(f"_add_* em lote + _finish_bulk  {t_lote / n * 1e9:8.0f} ns/chamada  ({t_pos / t_lote:.1f}x mais rápido)")
+    print(f"_add_* em lote, compacta       {t_cmp / n * 1e9:8.0f} ns/chamada")
+
+    # navegação: T.left(p) confere p e cria Position; node.left é só o campo
+    p, node = a.root(), a._root
+    t_nav_pos = _tempo(lambda: [a.left(p) for _ in range(n)])
+    t_nav_no = _tempo(lambda: [node.left for _ in range(n)])
+    print(f"T.left(p)                      {t_nav_pos / n * 1e9:8.0f} ns/chamada")
+    print(f"node.left                      {t_nav_no / n * 1e9:8.0f} ns/chamada")
+
+    # lista encadeada (altura n - 1): sem lote cada nó sobe o caminho todo, O(n²)
+    for m in (2_500, 5_000):
+        def lista(lote):
+            T = LinkedBinaryTree()
+            if lote:
+                T._begin_bulk()
+            q = T._add_root(0)
+            for i in range(1, m):
+                q = T._add_left(q, i)
+            if lote:
+                T._finish_bulk()
+        t_sem = _tempo(lambda: lista(False), repeticoes=1)
+        t_com = _tempo(lambda: lista(True), repeticoes=1)
+        print(f"lista de {m:5d} nós: _add_* {t_sem * 1000:8.1f} ms | em lote {t_com * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    bench_clone()
+    bench_caminho_rapido()
+    bench_segmentos()
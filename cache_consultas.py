@@ -0,0 +1,129 @@
+"""Cache de consultas caras sobre LinkedBinaryTree (linkedBinaryTree.py).
+
+Perguntas como "é árvore soma?" (Exercício 5), "quais os caminhos até as
+folhas?" (Exercício 6) ou "quem são os ancestrais de x?" (Exercício 7) só
+mudam de resposta quando a árvore muda. Cada árvore tem uma versão,
+trocada por add_*, replace, delete, attach e detach; o cache guarda a
+resposta junto com a versão e a devolve em O(1) enquanto ela for a mesma.
+Consultas por subárvore (p=...) usam a versão da subárvore, que só existe
+em árvores criadas com LinkedBinaryTree(subtree_versions=True).
+
+    cache = CacheConsultas(maxsize=256)
+    cache.consultar(buscar_ancestrais, T, 5)       # calcula
+    cache.consultar(buscar_ancestrais, T, 5)       # devolve a mesma resposta
+    cache.consultar(altura, T, p=pos)              # só depende da subárvore de pos
+
+Os argumentos extras precisam ser hasheáveis. A resposta guardada é
+devolvida como está (não é copiada), e mudanças feitas dentro de um
+elemento mutável não trocam a versão.
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class CacheConsultas:
+    """Memoização com despejo LRU, invalidada pelas versões da árvore."""
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("maxsize deve ser pelo menos 1")
+        self._maxsize = maxsize
+        # chave -> (versão quando foi calculada, resposta)
+        self._dados: "OrderedDict[Tuple[Any, ...], Tuple[int, Any]]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0}
+
+    def consultar(self, funcao: Callable[..., Any], T: Any, *args: Any, p: Optional[Any] = None) -> Any:
+        """Resposta de funcao(T, *args), ou de funcao(T, p, *args) se p for dado.
+
+        Com p, a resposta só pode depender da subárvore de p: ela continua
+        valendo enquanto nada mudar lá dentro, mesmo que o resto da árvore
+        mude.
+        """
+        versao = T.version(p)
+        alvo = T if p is None else T._validate(p)
+        chave = (funcao, alvo, args)
+        item = self._dados.get(chave)
+        if item is not None:
+            if item[0] == versao:
+                self._stats["hits"] += 1
+                self._dados.move_to_end(chave)
+                return item[1]
+            self._stats["stale"] += 1
+        else:
+            self._stats["misses"] += 1
+        resposta = funcao(T, *args) if p is None else funcao(T, p, *args)
+        self._dados[chave] = (versao, resposta)
+        self._dados.move_to_end(chave)
+        if len(self._dados) > self._maxsize:
+            self._dados.popitem(last=False)
+            self._stats["evictions"] += 1
+        return resposta
+
+    def memoizar(self, funcao: Callable[..., Any]) -> Callable[..., Any]:
+        """Decorador: f(T, *args, p=None) passa a consultar este cache."""
+        @wraps(funcao)
+        def f(T: Any, *args: Any, p: Optional[Any] = None) -> Any:
+            return self.consultar(funcao, T, *args, p=p)
+        return f
+
+    def limpar(self) -> None:
+        """Esquece todas as respostas (os contadores continuam)."""
+        self._dados.clear()
+
+    def __len__(self) -> int:
+        return len(self._dados)
+
+    def stats(self) -> Dict[str, int]:
+        """hits, misses, stale (resposta velha recalculada), evictions e tamanho atual."""
+        stats = dict(self._stats)
+        stats["size"] = len(self._dados)
+        return stats
+
+
+# ---------------- exemplo rápido de uso ----------------
+if __name__ == "__main__":
+    from linkedBinaryTree import LinkedBinaryTree
+
+    cache = CacheConsultas(maxsize=64)
+
+    @cache.memoizar
+    def eh_arvore_soma(T, p=None):
+        # mesma regra do Exercício 5, percorrendo a subárvore toda
+        nos = T.postorder() if p is None else T._subtree_postorder(p)
+        for q in nos:
+            filhos = list(T.children(q))
+            if filhos and q.element() != sum(c.element() for c in filhos):
+                return False
+        return True
+
+    def ancestrais(T, valor):
+        # como no Exercício 7: caminho da raiz até o nó com valor
+        for q in T.preorder():
+            if q.element() == valor:
+                caminho = []
+                while q is not None:
+                    caminho.append(q.element())
+                    q = T.parent(q)
+                return caminho[::-1]
+        return None
+
+    T = LinkedBinaryTree(subtree_versions=True)
+    r = T.add_root(13)
+    a = T.add_left(r, 10)
+    b = T.add_right(r, 3)
+    T.add_left(a, 4)
+    T.add_right(a, 6)
+    T.add_right(b, 3)
+
+    print("árvore soma?", eh_arvore_soma(T), "| de novo:", eh_arvore_soma(T))
+    print("ancestrais de 6:", cache.consultar(ancestrais, T, 6), cache.consultar(ancestrais, T, 6))
+    print("subárvore de 10 é soma?", eh_arvore_soma(T, p=a))
+    print(cache.stats())
+
+    T.replace(b, 4)        # muda só o lado direito
+    print("\ndepois de trocar 3 por 4 no lado direito:")
+    print("árvore soma?", eh_arvore_soma(T), "| subárvore de 10 (ainda em cache):", eh_arvore_soma(T, p=a))
+    print("versões: árvore", T.version(), "| subárvore de 10", T.version(a))
+    print(cache.stats())
@@ -0,0 +1,267 @@
+"""Compila árvores de expressão (LinkedBinaryTree) em funções Python.
+
+Nós internos guardam operadores ("+", "-", "*", "/", "//", "%", "**"; um
+nó com um filho só e "-" é o menos unário) e as folhas guardam operandos:
+números, nomes de variáveis (str) ou qualquer outra constante.
+
+A árvore é percorrida uma única vez, em pós-ordem com pilha explícita (sem
+recursão), e vira código de três endereços (_t0 = x + y; _t1 = _t0 * 2;
+...), sem parênteses aninhados, então até expressões muito fundas compilam
+e rodam no modo "source". O modo "closure" chama uma função por nível da
+árvore, então fica limitado pelo limite de recursão do Python: acima de
+metade de sys.getrecursionlimit() de altura, compilar(T, modo="closure")
+recusa com ValueError.
+
+    f = compilar(T)          # f(x=1, y=2) ou f(1, 2) (variáveis em ordem alfabética)
+    g = compilar(T, modo="closure")
+    h = compilar_numpy(T)    # h(x=array, y=array) -> array
+"""
+
+import keyword
+import operator
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+OPERADORES: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "//": operator.floordiv,
+    "%": operator.mod,
+    "**": operator.pow,
+}
+
+
+def _eh_variavel(e: Any) -> bool:
+    if not isinstance(e, str):
+        return False
+    if not e.isidentifier() or keyword.iskeyword(e) or e.startswith("_"):
+        raise ValueError(f"nome de variável inválido: {e!r}")
+    return True
+
+
+def _posordem(T: Any) -> Iterator[Tuple[Any, bool, bool, int]]:
+    """(elemento, tem esquerdo?, tem direito?, profundidade) de cada nó, em pós-ordem.
+
+    Pilha explícita: T.postorder() é recursivo e estoura em árvores fundas.
+    """
+    pilha: List[Tuple[Any, int, bool]] = [(T.root(), 0, False)]
+    while pilha:
+        p, prof, filhos_prontos = pilha.pop()
+        esq, dir = T.left(p), T.right(p)
+        if filhos_prontos:
+            yield p.element(), esq is not None, dir is not None, prof
+            continue
+        pilha.append((p, prof, True))
+        if dir is not None:
+            pilha.append((dir, prof + 1, False))
+        if esq is not None:
+            pilha.append((esq, prof + 1, False))
+
+
+def _codigo_de_tres_enderecos(T: Any) -> Tuple[List[str], str, List[Any], List[str]]:
+    """Percorre T em pós-ordem e devolve (linhas, resultado, constantes, variáveis)."""
+    if T.is_empty():
+        raise ValueError("árvore de expressão vazia")
+    linhas: List[str] = []
+    constantes: List[Any] = []
+    variaveis: set = set()
+    pilha: List[str] = []       # operandos já prontos (nome ou literal)
+    for e, tem_esq, tem_dir, _ in _posordem(T):
+        if not tem_esq and not tem_dir:
+            if _eh_variavel(e):
+                variaveis.add(e)
+                pilha.append(e)
+            elif type(e) is int or (type(e) is float and e == e and abs(e) != float("inf")):
+                # literal direto no código; negativos entre parênteses por causa do **
+                pilha.append(f"({e!r})" if e < 0 else repr(e))
+            else:
+                pilha.append(f"_c[{len(constantes)}]")
+                constantes.append(e)
+            continue
+        if e not in OPERADORES:
+            raise ValueError(f"operador desconhecido: {e!r}")
+        destino = f"_t{len(linhas)}"
+        if tem_esq and tem_dir:
+            b = pilha.pop()
+            a = pilha.pop()
+            linhas.append(f"{destino} = {a} {e} {b}")
+        elif e == "-":
+            linhas.append(f"{destino} = -{pilha.pop()}")
+        else:
+            raise ValueError(f"operador {e!r} precisa de dois operandos")
+        pilha.append(destino)
+    return linhas, pilha[-1], constantes, sorted(variaveis)
+
+
+def _compilar_fonte(T: Any, nome: str) -> Callable[..., Any]:
+    linhas, resultado, constantes, variaveis = _codigo_de_tres_enderecos(T)
+    corpo = "".join(f"    {linha}\n" for linha in linhas)
+    # **_outras: o mesmo dicionário de valores pode trazer variáveis a mais
+    fonte = f"def {nome}({''.join(v + ', ' for v in variaveis)}**_outras):\n{corpo}    return {resultado}\n"
+    ambiente: Dict[str, Any] = {"_c": tuple(constantes)}
+    exec(compile(fonte, f"<expressão {nome}>", "exec"), ambiente)
+    f = ambiente[nome]
+    f.variaveis = variaveis
+    f.fonte = fonte
+    return f
+
+
+def _compilar_closure(T: Any) -> Callable[..., Any]:
+    """Cadeia de closures: uma função pequena por nó, montada em pós-ordem.
+
+    Avaliar desce uma chamada por nível, então a altura da árvore fica
+    limitada a metade do limite de recursão (ValueError acima disso).
+    """
+    if T.is_empty():
+        raise ValueError("árvore de expressão vazia")
+    limite = sys.getrecursionlimit() // 2
+    pilha: List[Callable[[Dict[str, Any]], Any]] = []
+    variaveis: set = set()
+    for e, tem_esq, tem_dir, prof in _posordem(T):
+        if prof >= limite:
+            raise ValueError(f"expressão funda demais para o modo closure (altura >= {limite});"
+                             " use modo=\"source\"")
+        if not tem_esq and not tem_dir:
+            if _eh_variavel(e):
+                variaveis.add(e)
+                pilha.append(lambda env, nome=e: env[nome])
+            else:
+                pilha.append(lambda env, c=e: c)
+            continue
+        if e not in OPERADORES:
+            raise ValueError(f"operador desconhecido: {e!r}")
+        if tem_esq and tem_dir:
+            fb = pilha.pop()
+            fa = pilha.pop()
+            pilha.append(lambda env, a=fa, b=fb, op=OPERADORES[e]: op(a(env), b(env)))
+        elif e == "-":
+            fa = pilha.pop()
+            pilha.append(lambda env, a=fa: -a(env))
+        else:
+            raise ValueError(f"operador {e!r} precisa de dois operandos")
+    raiz = pilha[-1]
+    nomes = sorted(variaveis)
+
+    def f(*args: Any, **kwargs: Any) -> Any:
+        env = dict(zip(nomes, args))
+        env.update(kwargs)
+        try:
+            return raiz(env)
+        except KeyError as erro:
+            if erro.args and erro.args[0] in nomes and erro.args[0] not in env:
+                # mesmo erro do modo "source" (argumento obrigatório faltando)
+                raise TypeError(f"expressao() sem valor para a variável {erro.args[0]!r}") from None
+            raise
+
+    f.variaveis = nomes
+    return f
+
+
+def compilar(T: Any, modo: str = "source") -> Callable[..., Any]:
+    """Transforma a árvore de expressão T numa função reutilizável.
+
+    modo="source" gera e compila código Python (mais rápido);
+    modo="closure" monta uma cadeia de closures (sem exec/compile; altura
+    limitada a metade de sys.getrecursionlimit()).
+    A função aceita as variáveis por nome ou na ordem de f.variaveis; nos
+    dois modos, faltar alguma levanta TypeError.
+    """
+    if modo == "source":
+        return _compilar_fonte(T, "expressao")
+    if modo == "closure":
+        return _compilar_closure(T)
+    raise ValueError(f"modo desconhecido: {modo!r}")
+
+
+def compilar_numpy(T: Any) -> Callable[..., Any]:
+    """Versão vetorizada: cada variável recebe um array e o resultado é um array.
+
+    O código gerado é o mesmo do modo "source"; os operadores aritméticos do
+    NumPy já trabalham elemento a elemento (com broadcasting).
+    """
+    try:
+        import numpy as np
+    except ImportError as erro:
+        raise ImportError("compilar_numpy precisa do pacote numpy") from erro
+    f = _compilar_fonte(T, "expressao_vetorizada")
+
+    def g(*args: Any, **kwargs: Any) -> Any:
+        valores = dict(zip(f.variaveis, args))
+        valores.update(kwargs)
+        arrays = {k: np.asarray(v) for k, v in valores.items() if k in f.variaveis}
+        forma = np.broadcast_shapes(*(a.shape for a in arrays.values())) if arrays else ()
+        r = f(**arrays)
+        if isinstance(r, np.ndarray) and r.shape == forma and not any(r is a for a in arrays.values()):
+            return r        # array novo e já na forma certa
+        # broadcast_to devolve uma vista só de leitura: copia para o chamador poder alterar
+        return np.array(np.broadcast_to(r, forma))
+
+    g.variaveis = f.variaveis
+    g.fonte = f.fonte
+    return g
+
+
+# ---------------- exemplo rápido de uso ----------------
+if __name__ == "__main__":
+    import timeit
+
+    from linkedBinaryTree import LinkedBinaryTree
+
+    # (x + 3) * (y - x / 2)
+    T = LinkedBinaryTree()
+    r = T.add_root("*")
+    soma = T.add_left(r, "+")
+    T.add_left(soma, "x")
+    T.add_right(soma, 3)
+    sub = T.add_right(r, "-")
+    T.add_left(sub, "y")
+    div = T.add_right(sub, "/")
+    T.add_left(div, "x")
+    T.add_right(div, 2)
+
+    f = compilar(T)
+    g = compilar(T, modo="closure")
+    print("código gerado:")
+    print(f.fonte)
+    print("f(x=4, y=10) =", f(x=4, y=10), "| closure:", g(x=4, y=10), "| posicional:", f(4, 10))
+
+    def reinterpreta(x, y):
+        # avaliação ingênua: percorre a árvore toda a cada chamada
+        pilha = []
+        for p in T.postorder():
+            e = p.element()
+            if e in OPERADORES and T.left(p) is not None:
+                b, a = pilha.pop(), pilha.pop()
+                pilha.append(OPERADORES[e](a, b))
+            else:
+                pilha.append({"x": x, "y": y}.get(e, e))
+        return pilha[-1]
+
+    n = 20_000
+    print(f"\n{n} avaliações:")
+    print(f"  percorrendo a árvore  {timeit.timeit(lambda: reinterpreta(4, 10), number=n):.3f} s")
+    print(f"  closure               {timeit.timeit(lambda: g(x=4, y=10), number=n):.3f} s")
+    print(f"  source compilado      {timeit.timeit(lambda: f(x=4, y=10), number=n):.3f} s")
+
+    # expressão bem funda: x + 1 + 1 + ... (1000 níveis)
+    F = LinkedBinaryTree()
+    no = F.add_root("+")
+    for _ in range(1000):
+        F.add_right(no, 1)
+        no = F.add_left(no, "+")
+    F.add_left(no, "x")
+    F.add_right(no, 1)
+    print(f"\naltura {F.height()}: source ->", compilar(F)(x=0), end=" | ")
+    try:
+        compilar(F, modo="closure")
+    except ValueError as erro:
+        print("closure ->", erro)
+
+    try:
+        import numpy as np
+        h = compilar_numpy(T)
+        print("\nNumPy:", h(x=np.arange(5.0), y=10))
+    except ImportError:
+        print("\n(numpy não instalado: compilar_numpy indisponível)")
@@ -0,0 +1,384 @@
+"""Rope: texto grande guardado numa árvore binária (nós do linkedBinaryTree.py).
+
+As folhas guardam pedaços do texto (str) e cada nó guarda o comprimento
+total da sua subárvore, então achar o caractere i é só descer pela árvore.
+Juntar dois textos de alturas parecidas é criar um nó novo e pendurar as
+duas árvores nele com attach (nada é copiado); se uma for bem mais alta, o
+nó novo entra na borda dela, na altura da outra, e rotações como as de uma
+AVL mantêm a árvore balanceada. Cortar em i separa as subárvores que ficam
+de cada lado do caminho até a folha de i e junta cada lado de novo; só o
+pedaço da folha cortada é copiado.
+
+- concat, split, insert, delete e index: O(log n) (n = quantidade de folhas)
+- quando sobram folhas pequenas demais (muitas inserções curtas), a árvore
+  é refeita juntando folhas vizinhas (O(n), mas raro: custo amortizado O(1))
+- chunks() percorre os pedaços sem copiar nada (bom para gravar em arquivo)
+
+Como no attach, concat esvazia a outra rope e split tira o final desta;
+cada texto existe em um lugar só.
+"""
+
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from arvore_balanceada import ArvoreBalanceada, bloqueado
+from linkedBinaryTree import LinkedBinaryTree
+
+
+class Rope(ArvoreBalanceada):
+    """Texto em árvore: folhas com pedaços, nós internos com o comprimento total."""
+
+    class _Node(LinkedBinaryTree._Node):
+        __slots__ = "comprimento",
+
+        def __init__(self, element: Any, parent: Optional["LinkedBinaryTree._Node"] = None):
+            super().__init__(element, parent)
+            self.comprimento = len(element) if element is not None else 0
+
+    add_root = add_left = add_right = replace = attach = detach = prune = \
+        bloqueado("monta a própria árvore; use concat/split/insert/delete")
+
+    def __init__(self, texto: str = "", chunk: int = 1024):
+        """Rope com texto, dividido em folhas de até chunk caracteres."""
+        super().__init__()
+        if chunk < 1:
+            raise ValueError("chunk deve ser pelo menos 1")
+        self._chunk = chunk
+        if texto:
+            folhas = [self._folha(texto[k:k + chunk]) for k in range(0, len(texto), chunk)]
+            self._root = self._monta(folhas)
+            self._size = self._root.size
+
+    def clone(self, p: Any = None, shallow_elements: bool = True,
+              memo: Optional[dict] = None) -> "Rope":
+        """Cópia independente (de p, é o texto daquela subárvore)."""
+        other = super().clone(p, shallow_elements, memo)
+        other._chunk = self._chunk
+        return other
+
+    # ---------------- internos ----------------
+    def _folha(self, s: str) -> "_Node":
+        node = self._new_node(s)
+        node.comprimento = len(s)
+        return node
+
+    def _fix_upward(self, node: Optional["_Node"], delta: int) -> None:
+        """Como no linkedBinaryTree.py, e também o comprimento dos nós internos."""
+        super()._fix_upward(node, delta)
+        while node is not None:
+            if node.left is not None:
+                node.comprimento = node.left.comprimento + node.right.comprimento
+            node = node.parent
+
+    def _monta(self, folhas: List["_Node"]) -> "_Node":
+        """Árvore balanceada sobre as folhas (em ordem): cada metade de um lado.
+
+        As metades diferem em no máximo uma folha, então as alturas dos dois
+        lados de cada nó diferem em no máximo 1 (a regra da AVL que o concat
+        depois mantém). A recursão só tem O(log n) níveis.
+        """
+        v = self._nova_versao()
+        self._shape += 1
+        for f in folhas:
+            f.parent = f.left = f.right = None
+            f.height, f.size = 0, 1
+
+        def monta(lo: int, hi: int) -> "Rope._Node":
+            if hi - lo == 1:
+                return folhas[lo]
+            m = (lo + hi) // 2
+            p = self._new_node(None)
+            p.left, p.right = monta(lo, m), monta(m, hi)
+            p.left.parent = p.right.parent = p
+            self._refresh(p)
+            p.version = v
+            return p
+
+        return monta(0, len(folhas))
+
+    def _une(self, a: "_Node", b: "_Node") -> "_Node":
+        """Junta as subárvores soltas a e b (nessa ordem) e devolve a raiz.
+
+        Usa self._root como rascunho; é o concat sem criar Ropes no meio.
+        """
+        a.parent = b.parent = None
+        if abs(a.height - b.height) <= 1:
+            p = self._new_node(None)
+            p.left, p.right = a, b
+            a.parent = b.parent = p
+            self._refresh(p)
+            p.version = self._nova_versao()
+            self._shape += 1
+            self._root = p
+        else:
+            self._junta(a, b)
+        return self._root
+
+    def _esvazia(self) -> "Rope":
+        """Passa todos os nós desta rope para uma nova e deixa esta vazia."""
+        r = Rope(chunk=self._chunk)
+        r._root, r._size = self._root, self._size
+        self._root, self._size = None, 0
+        self._epoch += 1
+        r._version = self._nova_versao()
+        self._shape += 1
+        return r
+
+    def _folhas(self) -> Iterator["_Node"]:
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.left is None:
+                yield node
+            else:
+                stack.append(node.right)
+                stack.append(node.left)
+
+    @staticmethod
+    def _refresh(node: "_Node") -> None:
+        a, b = node.left, node.right
+        node.height = 1 + (a.height if a.height > b.height else b.height)
+        node.size = a.size + b.size + 1
+        node.comprimento = a.comprimento + b.comprimento
+
+    def _junta(self, a: "_Node", b: "_Node") -> None:
+        """Raiz com o texto de a seguido do de b, quando as alturas são bem diferentes."""
+        p = self._new_node(None)
+        if a.height > b.height:
+            self._root = c = a
+            while c.height > b.height + 1:
+                c = c.right
+            pai = c.parent
+            pai.right = p
+            p.left, p.right = c, b
+        else:
+            self._root = c = b
+            while c.height > a.height + 1:
+                c = c.left
+            pai = c.parent
+            pai.left = p
+            p.left, p.right = a, c
+        p.parent = pai
+        p.left.parent = p.right.parent = p
+        self._rebalance(p)
+        self._size = self._root.size
+
+    def _fragmentada(self) -> bool:
+        # depois de rebalance() há no máximo ~4·len/chunk folhas
+        return self.leaves() > 8 * len(self) // self._chunk + 16
+
+    def rebalance(self) -> None:
+        """Refaz a árvore, juntando folhas vizinhas pequenas. O(n).
+
+        Roda sozinha quando há folhas pequenas demais; a altura já fica
+        O(log n) sem ela.
+        """
+        if self._root is None:
+            return
+        folhas: List[Rope._Node] = []
+        for f in self._folhas():
+            ultima = folhas[-1] if folhas else None
+            if ultima is not None and ultima.comprimento + f.comprimento <= self._chunk // 2:
+                folhas[-1] = self._folha(ultima.element + f.element)
+            else:
+                folhas.append(f)
+        self._root = self._monta(folhas)
+        self._size = self._root.size
+        self._epoch += 1
+
+    def _localiza(self, i: int) -> int:
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("índice fora do texto")
+        return i
+
+    # ---------------- operações ----------------
+    def __len__(self) -> int:
+        """Quantidade de caracteres (não de nós)."""
+        return self._root.comprimento if self._root is not None else 0
+
+    def leaves(self) -> int:
+        """Quantidade de folhas (pedaços)."""
+        return (self._size + 1) // 2
+
+    def concat(self, other: "Rope") -> None:
+        """Coloca o texto de other no fim deste; other fica vazia."""
+        if other is self:
+            raise ValueError("não dá para concatenar uma rope com ela mesma")
+        if other._root is None:
+            return
+        if self._root is None:
+            r = other._esvazia()
+            self._root, self._size = r._root, r._size
+            return
+        if abs(self._root.height - other._root.height) <= 1:
+            esq = self._esvazia()
+            self._root = self._new_node(None)
+            self._size = 1
+            LinkedBinaryTree.attach(self, self._make_position(self._root), esq, other)
+        else:
+            a, b = self._root, other._root
+            other._root, other._size = None, 0
+            other._epoch += 1
+            other._nova_versao()
+            other._shape += 1
+            self._epoch += 1
+            self._junta(a, b)
+        if self._fragmentada():
+            self.rebalance()
+
+    def split(self, i: int) -> "Rope":
+        """Corta em i: esta rope fica com [0, i) e a devolvida com [i, fim)."""
+        n = len(self)
+        if not 0 <= i <= n:
+            raise IndexError("posição de corte fora do texto")
+        if i == n:
+            return Rope(chunk=self._chunk)
+        if i == 0:
+            return self._esvazia()
+        esq: List[Rope._Node] = []    # subárvores à esquerda do corte, de cima para baixo
+        dir: List[Rope._Node] = []    # idem à direita
+        node = self._root
+        while node.left is not None:
+            pai = node
+            if i < node.left.comprimento:
+                dir.append(node.right)
+                node = node.left
+            else:
+                i -= node.left.comprimento
+                esq.append(node.left)
+                node = node.right
+            pai.parent = pai          # nó interno do caminho sai da árvore
+        if i == 0:
+            dir.append(node)
+        else:
+            esq.append(self._folha(node.element[:i]))
+            dir.append(self._folha(node.element[i:]))
+            node.parent = node
+        self._epoch += 1
+        # juntando do menor para o maior a altura continua O(log n)
+        fim = dir.pop()
+        while dir:
+            fim = self._une(fim, dir.pop())
+        fim.parent = None
+        inicio = esq.pop()
+        while esq:
+            inicio = self._une(esq.pop(), inicio)
+        inicio.parent = None
+        self._root, self._size = inicio, inicio.size
+        self._nova_versao()
+        self._shape += 1
+        resto = Rope(chunk=self._chunk)
+        resto._root, resto._size = fim, fim.size
+        resto._version = self._version
+        return resto
+
+    def insert(self, i: int, texto: Union[str, "Rope"]) -> None:
+        """Insere texto (str ou Rope, que fica vazia) na posição i."""
+        meio = texto if isinstance(texto, Rope) else Rope(texto, self._chunk)
+        resto = self.split(i)
+        self.concat(meio)
+        self.concat(resto)
+
+    def delete(self, i: int, j: int) -> None:
+        """Apaga os caracteres de [i, j)."""
+        if not 0 <= i <= j <= len(self):
+            raise IndexError("intervalo fora do texto")
+        resto = self.split(j)
+        self.split(i)
+        self.concat(resto)
+
+    def index(self, i: int) -> str:
+        """Caractere na posição i. O(altura)."""
+        i = self._localiza(i)
+        node = self._root
+        while node.left is not None:
+            if i < node.left.comprimento:
+                node = node.left
+            else:
+                i -= node.left.comprimento
+                node = node.right
+        return node.element[i]
+
+    def _pedacos(self, i: int, j: int) -> Iterator[str]:
+        """Pedaços que cobrem [i, j), cortando só as pontas."""
+        stack: List[Tuple[Rope._Node, int]] = [(self._root, 0)] if self._root is not None else []
+        while stack:
+            node, ini = stack.pop()
+            fim = ini + node.comprimento
+            if fim <= i or ini >= j:
+                continue
+            if node.left is not None:
+                stack.append((node.right, ini + node.left.comprimento))
+                stack.append((node.left, ini))
+            elif i <= ini and fim <= j:
+                yield node.element
+            else:
+                yield node.element[max(i - ini, 0):j - ini]
+
+    def __getitem__(self, k: Union[int, slice]) -> str:
+        if isinstance(k, slice):
+            i, j, passo = k.indices(len(self))
+            if passo != 1:
+                return "".join(self._pedacos(0, len(self)))[k]
+            return "".join(self._pedacos(i, j)) if i < j else ""
+        return self.index(k)
+
+    def chunks(self) -> Iterator[str]:
+        """Os pedaços do texto em ordem, sem cópia."""
+        for f in self._folhas():
+            yield f.element
+
+    def write(self, fp: Any) -> None:
+        """Grava o texto em fp pedaço por pedaço."""
+        for c in self.chunks():
+            fp.write(c)
+
+    def __iter__(self) -> Iterator[str]:
+        for c in self.chunks():
+            yield from c
+
+    def __str__(self) -> str:
+        return "".join(self.chunks())
+
+    def __repr__(self) -> str:
+        return f"Rope({len(self)} caracteres, {self.leaves()} pedaços, altura {self._root.height if self._root else -1})"
+
+
+# ---------------- exemplo rápido de uso ----------------
+if __name__ == "__main__":
+    import io
+    import time
+
+    r = Rope("Árvores binárias ", chunk=8)
+    r.concat(Rope("guardam texto", chunk=8))
+    print(str(r), "|", repr(r))
+    r.insert(17, "também ")
+    print(str(r))
+    r.delete(0, 8)
+    print(str(r), "| r[0] =", r[0], "| r[8:15] =", r[8:15])
+    fim = r.split(8)
+    print("split(8):", repr(str(r)), "+", repr(str(fim)))
+
+    # concatenação repetida: str copia tudo a cada passo, a rope não
+    n = 5_000
+    pedaco = "x" * 100
+    t0 = time.perf_counter()
+    s = ""
+    for _ in range(n):
+        s = pedaco + s          # no começo: sem a otimização de += do CPython
+    t1 = time.perf_counter()
+    grande = Rope()
+    for _ in range(n):
+        novo = Rope(pedaco)
+        novo.concat(grande)
+        grande = novo
+    t2 = time.perf_counter()
+    print(f"\n{n} concatenações no começo: str {t1 - t0:.3f} s, rope {t2 - t1:.3f} s ({grande!r})")
+    for k in range(1, 200):
+        grande.insert(k * 997, "#")
+    print("199 inserções no meio; grande[997:1000] =", grande[997:1000], "|", repr(grande))
+    saida = io.StringIO()
+    grande.write(saida)
+    print("gravado pedaço por pedaço:", len(saida.getvalue()), "caracteres")
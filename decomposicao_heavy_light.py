@@ -0,0 +1,149 @@
+"""Decomposição heavy-light sobre um LinkedBinaryTree (linkedBinaryTree.py).
+
+Cada nó escolhe como filho "pesado" o filho com a maior subárvore (o
+tamanho já fica guardado em cada nó). Descendo sempre pelo filho pesado
+primeiro, cada cadeia pesada ocupa um trecho contíguo da numeração, e
+qualquer caminho entre dois nós cruza no máximo O(log n) cadeias. Os
+valores ficam numa SegmentTree nessa numeração, então:
+
+- path_sum / path_min / path_max(p, q): O(log² n)
+- replace(p, e): O(log n) (mais a profundidade de p se a árvore foi
+  criada com subtree_versions=True, porque tree.replace sobe até a raiz)
+
+O índice vale enquanto a forma da árvore não muda; replace pode ser
+usado à vontade (pelo índice, para manter os dois sincronizados). Árvores
+compactas (compact=True) não guardam o tamanho dos nós e dão TypeError.
+"""
+
+from typing import Any, Callable, Dict, List
+
+from arvore_segmentos import SegmentTree
+
+
+class HeavyLightIndex:
+    """Consultas de soma/mínimo/máximo em caminhos de uma árvore com valores numéricos."""
+
+    def __init__(self, tree: Any):
+        if getattr(tree, "_compact", False):
+            # o filho pesado sai do tamanho guardado em cada nó, que o nó compacto não tem
+            raise TypeError("HeavyLightIndex precisa de uma árvore não compacta (compact=False)")
+        self._tree = tree
+        self._shape = tree._shape     # muda com add_*/delete/attach/detach, não com replace
+        n = len(tree)
+        self._pos: Dict[Any, int] = {}          # nó -> posição na numeração
+        self._nodes: List[Any] = [None] * n     # posição -> nó
+        self._head: List[int] = [0] * n         # posição da cabeça da cadeia
+        self._parent: List[int] = [-1] * n      # posição do pai (-1 na raiz)
+        self._depth: List[int] = [0] * n
+        valores: List[Any] = [0] * n
+        if n:
+            # (nó, posição do pai, posição da cabeça da cadeia; -1 = começa cadeia nova)
+            stack = [(tree._root, -1, -1)]
+            nxt = 0
+            while stack:
+                node, par, head = stack.pop()
+                i = nxt
+                nxt += 1
+                self._pos[node] = i
+                self._nodes[i] = node
+                self._parent[i] = par
+                self._head[i] = i if head < 0 else head
+                self._depth[i] = self._depth[par] + 1 if par >= 0 else 0
+                valores[i] = node.element
+                kids = [c for c in (node.left, node.right) if c is not None]
+                if not kids:
+                    continue
+                heavy = max(kids, key=lambda c: c.size)
+                for c in kids:
+                    if c is not heavy:
+                        stack.append((c, i, -1))
+                stack.append((heavy, i, self._head[i]))   # sai primeiro: continua a cadeia
+        self._seg = SegmentTree(valores)
+
+    # ---------------- internos ----------------
+    def _index(self, p: Any) -> int:
+        if self._tree._shape != self._shape:
+            raise RuntimeError("a forma da árvore mudou; construa o índice de novo")
+        node = self._tree._validate(p)
+        try:
+            return self._pos[node]
+        except KeyError:
+            raise ValueError("Position não está no índice (nó adicionado depois?)") from None
+
+    def _path(self, p: Any, q: Any, query: Callable[[int, int], Any], junta: Callable[[Any, Any], Any]) -> Any:
+        u = self._index(p)
+        v = self._index(q) if q is not None else 0
+        head, parent, depth = self._head, self._parent, self._depth
+        res = None
+        while head[u] != head[v]:
+            if depth[head[u]] < depth[head[v]]:
+                u, v = v, u
+            parte = query(head[u], u + 1)
+            res = parte if res is None else junta(res, parte)
+            u = parent[head[u]]
+        if u > v:
+            u, v = v, u
+        parte = query(u, v + 1)
+        return parte if res is None else junta(res, parte)
+
+    # ---------------- consultas ----------------
+    def path_sum(self, p: Any, q: Any = None) -> Any:
+        """Soma dos valores no caminho de p até q (até a raiz, se q for None), inclusive."""
+        return self._path(p, q, self._seg.query, lambda a, b: a + b)
+
+    def path_min(self, p: Any, q: Any = None) -> Any:
+        """Menor valor no caminho de p até q (ou até a raiz)."""
+        return self._path(p, q, self._seg.query_min, min)
+
+    def path_max(self, p: Any, q: Any = None) -> Any:
+        """Maior valor no caminho de p até q (ou até a raiz)."""
+        return self._path(p, q, self._seg.query_max, max)
+
+    def lca(self, p: Any, q: Any) -> Any:
+        """Ancestral comum mais baixo de p e q (como Position)."""
+        u, v = self._index(p), self._index(q)
+        while self._head[u] != self._head[v]:
+            if self._depth[self._head[u]] < self._depth[self._head[v]]:
+                u, v = v, u
+            u = self._parent[self._head[u]]
+        return self._tree._make_position(self._nodes[min(u, v)])
+
+    # ---------------- atualizações ----------------
+    def replace(self, p: Any, e: Any) -> Any:
+        """tree.replace(p, e) mantendo o índice em dia. Retorna o valor antigo."""
+        i = self._index(p)
+        old = self._tree.replace(p, e)
+        self._seg.update(i, e)
+        return old
+
+    def refresh(self, p: Any) -> None:
+        """Relê o valor de p (para quando alguém chamou tree.replace direto)."""
+        i = self._index(p)
+        self._seg.update(i, self._nodes[i].element)
+
+
+# ---------------- exemplo rápido de uso ----------------
+if __name__ == "__main__":
+    from linkedBinaryTree import LinkedBinaryTree
+
+    # mesma árvore do Exercício 7
+    T = LinkedBinaryTree()
+    r = T.add_root(1)
+    n2 = T.add_left(r, 2)
+    n3 = T.add_right(r, 3)
+    n4 = T.add_left(n2, 4)
+    n5 = T.add_right(n2, 5)
+    n6 = T.add_left(n3, 6)
+    n7 = T.add_right(n3, 7)
+    n8 = T.add_left(n6, 8)
+    n9 = T.add_right(n7, 9)
+
+    hld = HeavyLightIndex(T)
+    print("soma de 9 até a raiz (9 + 7 + 3 + 1):", hld.path_sum(n9))
+    print("soma no caminho 8 -> 5 (8 6 3 1 2 5):", hld.path_sum(n8, n5))
+    print("mínimo / máximo em 8 -> 9:", hld.path_min(n8, n9), "/", hld.path_max(n8, n9))
+    print("lca(8, 9):", hld.lca(n8, n9).element())
+
+    hld.replace(n3, 100)
+    print("depois de trocar 3 por 100, soma 8 -> 5:", hld.path_sum(n8, n5),
+          "| máximo 4 -> 9:", hld.path_max(n4, n9))
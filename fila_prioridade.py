@@ -0,0 +1,242 @@
+"""Fila de prioridade em heap (árvore binária completa guardada num array).
+
+A árvore é implícita: o nó j tem pai (j - 1) // d e filhos d*j + 1 ... d*j + d,
+então navegar (root/left/right/parent/children) é só conta de índice. Com
+d = 2 é o heap binário clássico; d = 4 (ou mais) deixa a árvore mais baixa
+e os filhos de um nó vizinhos na memória, o que ajuda o cache.
+
+Cada item fica num Locator, devolvido por push (e por pushpop_locator);
+ele acompanha o item quando o heap o move e serve para mudar a chave
+depois (decrease_key / update) ou remover o item.
+"""
+
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+# valor padrão de update: "mantém o valor" (None é um valor como outro qualquer)
+_MANTER = object()
+
+
+class HeapPriorityQueue:
+    """Min-heap d-ário com heapify em O(n) e Locators para trocar chaves."""
+
+    class Locator:
+        """Item da fila: chave, valor e a posição atual no array."""
+        __slots__ = "_key", "_value", "_index"
+
+        def __init__(self, k: Any, v: Any, j: int):
+            self._key = k
+            self._value = v
+            self._index = j
+
+        def key(self) -> Any:
+            return self._key
+
+        def value(self) -> Any:
+            return self._value
+
+        def __lt__(self, other: "HeapPriorityQueue.Locator") -> bool:
+            return self._key < other._key
+
+        def __repr__(self) -> str:
+            return f"Locator({self._key!r}, {self._value!r})"
+
+    # ---------------- construtor ----------------
+    def __init__(self, items: Iterable[Tuple[Any, Any]] = (), d: int = 2):
+        """Monta o heap com os pares (chave, valor) de items em O(n)."""
+        if d < 2:
+            raise ValueError("d deve ser pelo menos 2")
+        self._d = d
+        self._data: List[HeapPriorityQueue.Locator] = [
+            self.Locator(k, v, j) for j, (k, v) in enumerate(items)]
+        self._heapify()
+
+    def _heapify(self) -> None:
+        # desce cada nó interno, do último até a raiz
+        for j in range(self._parent(len(self._data) - 1), -1, -1):
+            self._downheap(j)
+
+    # ---------------- navegação (árvore implícita) ----------------
+    def _parent(self, j: int) -> int:
+        return (j - 1) // self._d
+
+    def root(self) -> Optional[int]:
+        return 0 if self._data else None
+
+    def parent(self, j: int) -> Optional[int]:
+        return self._parent(j) if j > 0 else None
+
+    def children(self, j: int) -> Iterator[int]:
+        first = self._d * j + 1
+        yield from range(first, min(first + self._d, len(self._data)))
+
+    def left(self, j: int) -> Optional[int]:
+        if self._d != 2:
+            raise ValueError("left/right só existem no heap binário (d = 2); use children")
+        c = 2 * j + 1
+        return c if c < len(self._data) else None
+
+    def right(self, j: int) -> Optional[int]:
+        if self._d != 2:
+            raise ValueError("left/right só existem no heap binário (d = 2); use children")
+        c = 2 * j + 2
+        return c if c < len(self._data) else None
+
+    def locator(self, j: int) -> "HeapPriorityQueue.Locator":
+        """Item que está no nó j agora."""
+        return self._data[j]
+
+    # ---------------- movimentação ----------------
+    def _upheap(self, j: int) -> None:
+        data = self._data
+        item = data[j]
+        while j > 0:
+            p = (j - 1) // self._d
+            if not item._key < data[p]._key:
+                break
+            data[j] = data[p]
+            data[j]._index = j
+            j = p
+        data[j] = item
+        item._index = j
+
+    def _downheap(self, j: int) -> None:
+        data = self._data
+        n = len(data)
+        d = self._d
+        item = data[j]
+        while True:
+            first = d * j + 1
+            if first >= n:
+                break
+            # menor filho
+            small = first
+            for c in range(first + 1, min(first + d, n)):
+                if data[c]._key < data[small]._key:
+                    small = c
+            if not data[small]._key < item._key:
+                break
+            data[j] = data[small]
+            data[j]._index = j
+            j = small
+        data[j] = item
+        item._index = j
+
+    def _validate(self, loc: "HeapPriorityQueue.Locator") -> int:
+        if not isinstance(loc, HeapPriorityQueue.Locator):
+            raise TypeError("loc deve ser um Locator")
+        j = loc._index
+        if not (0 <= j < len(self._data) and self._data[j] is loc):
+            raise ValueError("Locator inválido (não está nesta fila)")
+        return j
+
+    # ---------------- operações públicas ----------------
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def is_empty(self) -> bool:
+        return len(self._data) == 0
+
+    def push(self, k: Any, v: Any = None) -> "HeapPriorityQueue.Locator":
+        """Insere (k, v) e devolve o Locator do item."""
+        loc = self.Locator(k, v, len(self._data))
+        self._data.append(loc)
+        self._upheap(loc._index)
+        return loc
+
+    def min(self) -> Tuple[Any, Any]:
+        if self.is_empty():
+            raise IndexError("fila de prioridade vazia")
+        item = self._data[0]
+        return item._key, item._value
+
+    def pop(self) -> Tuple[Any, Any]:
+        """Remove e devolve o par (chave, valor) de menor chave."""
+        if self.is_empty():
+            raise IndexError("fila de prioridade vazia")
+        last = self._data.pop()
+        if not self._data:
+            item = last
+        else:
+            item = self._data[0]
+            self._data[0] = last
+            last._index = 0
+            self._downheap(0)
+        item._index = -1
+        return item._key, item._value
+
+    def pushpop(self, k: Any, v: Any = None) -> Tuple[Any, Any]:
+        """Insere (k, v) e remove o mínimo, com uma descida só."""
+        return self.pushpop_locator(k, v)[0]
+
+    def pushpop_locator(self, k: Any, v: Any = None
+                        ) -> Tuple[Tuple[Any, Any], Optional["HeapPriorityQueue.Locator"]]:
+        """Como pushpop, mas devolve também o Locator do item inserido.
+
+        O Locator é None quando o próprio (k, v) sai na hora (era o menor).
+        """
+        if not self._data or not self._data[0]._key < k:
+            return (k, v), None
+        item = self._data[0]
+        loc = self._data[0] = self.Locator(k, v, 0)
+        self._downheap(0)
+        item._index = -1
+        return (item._key, item._value), loc
+
+    def update(self, loc: "HeapPriorityQueue.Locator", newkey: Any, newval: Any = _MANTER) -> None:
+        """Troca a chave (e o valor, se dado; pode ser None) do item de loc."""
+        j = self._validate(loc)
+        loc._key = newkey
+        if newval is not _MANTER:
+            loc._value = newval
+        if j > 0 and newkey < self._data[self._parent(j)]._key:
+            self._upheap(j)
+        else:
+            self._downheap(j)
+
+    def decrease_key(self, loc: "HeapPriorityQueue.Locator", newkey: Any) -> None:
+        """Diminui a chave do item de loc (erro se a nova chave for maior)."""
+        self._validate(loc)
+        if loc._key < newkey:
+            raise ValueError("a nova chave é maior que a atual")
+        loc._key = newkey
+        self._upheap(loc._index)
+
+    def remove(self, loc: "HeapPriorityQueue.Locator") -> Tuple[Any, Any]:
+        """Remove o item de loc de qualquer lugar do heap."""
+        j = self._validate(loc)
+        last = self._data.pop()
+        if j < len(self._data):
+            self._data[j] = last
+            last._index = j
+            if j > 0 and last._key < self._data[self._parent(j)]._key:
+                self._upheap(j)
+            else:
+                self._downheap(j)
+        loc._index = -1
+        return loc._key, loc._value
+
+    def __repr__(self) -> str:
+        return f"HeapPriorityQueue({[(l._key, l._value) for l in self._data]})"
+
+
+# ---------------- exemplo rápido de uso ----------------
+if __name__ == "__main__":
+    tarefas = [(5, "backup"), (1, "deploy"), (7, "relatório"), (3, "testes"), (9, "limpeza")]
+    fila = HeapPriorityQueue(tarefas)          # heapify O(n)
+    print(fila)
+    r = fila.root()
+    print("raiz:", fila.locator(r), "| filhos:", [fila.locator(c) for c in (fila.left(r), fila.right(r))])
+
+    loc = fila.push(6, "e-mails")
+    fila.decrease_key(loc, 0)                  # passa na frente de todo mundo
+    print("depois de decrease_key:", fila.min())
+    print("pushpop(2, 'revisão'):", fila.pushpop(2, "revisão"))
+    saiu, loc = fila.pushpop_locator(4, "deploy 2")
+    fila.update(loc, 4, None)                  # None também é um valor
+    print("pushpop_locator(4, ...):", saiu, "| item inserido:", loc)
+    print("em ordem:", [fila.pop() for _ in range(len(fila))])
+
+    # versão 4-ária (árvore mais baixa)
+    fila4 = HeapPriorityQueue((((k * 37) % 101, k) for k in range(20)), d=4)
+    print("4-ária, filhos da raiz:", [fila4.locator(c).key() for c in fila4.children(0)])
+    print("5 menores:", [fila4.pop()[0] for _ in range(5)])
@@ -0,0 +1,606 @@
+"""Floresta: muitas árvores binárias pequenas num arena só.
+
+Cada LinkedBinaryTree (linkedBinaryTree.py) carrega o próprio objeto, _root e
+_size, e os nós ficam espalhados pelo heap. Aqui os nós de todas as árvores
+ficam em arrays tipados (módulo array) compartilhados:
+
+    pai[i], esq[i], dir[i]   índices no arena (int32, -1 = nenhum)
+    arvore[i]                a que árvore o nó i pertence (-1 = removido)
+    elementos[i]             lista Python, ou array(typecode) se for numérico
+
+Forest[t] devolve um handle leve com a mesma API de Position do
+LinkedBinaryTree (root, left, right, children, preorder, inorder, add_*,
+replace, delete, ...), então as funções dos Exercícios aceitam o handle no
+lugar da árvore.
+
+Nós novos vão sempre para o fim do arena; delete só marca o nó como
+removido. compact() reescreve o arena com cada árvore contígua em pré-ordem
+(o mesmo formato de empacotar_arvores no Exercicio5.py) e invalida as
+Positions antigas. empacotar() entrega esses arrays para algoritmos em lote.
+"""
+
+from array import array
+from collections import deque
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # só empacotar() precisa do numpy
+    np = None
+
+_NONE = -1
+
+
+class Forest:
+    """Arena de nós em arrays tipados, com handles (Forest.Tree) por árvore."""
+
+    # ---------------- Position ----------------
+    class Position:
+        """Posição de um nó: o handle da árvore e o índice no arena."""
+        __slots__ = "_container", "_index", "_epoch"
+
+        def __init__(self, container: "Forest.Tree", index: int, epoch: int):
+            self._container = container
+            self._index = index
+            self._epoch = epoch  # época do arena (muda a cada compact)
+
+        def element(self) -> Any:
+            return self._container._forest._elems[self._index]
+
+        def __eq__(self, other: object) -> bool:
+            return (type(other) is type(self) and other._index == self._index
+                    and other._container == self._container)
+
+        def __ne__(self, other: object) -> bool:
+            return not (self == other)
+
+        def __hash__(self) -> int:
+            return hash((id(self._container._forest), self._index))
+
+        def __repr__(self) -> str:
+            return f"Position({self.element()!r})"
+
+    # ---------------- handle de uma árvore ----------------
+    class Tree:
+        """Uma árvore da floresta (só guarda a floresta e o número da árvore)."""
+        __slots__ = "_forest", "_id"
+
+        def __init__(self, forest: "Forest", tree_id: int):
+            self._forest = forest
+            self._id = tree_id
+
+        def __eq__(self, other: object) -> bool:
+            return type(other) is type(self) and other._forest is self._forest and other._id == self._id
+
+        def __ne__(self, other: object) -> bool:
+            return not (self == other)
+
+        def __hash__(self) -> int:
+            return hash((id(self._forest), self._id))
+
+        # ---- utilitários internos ----
+        def _validate(self, p: "Forest.Position") -> int:
+            """Transforma uma Position em índice do arena; levanta erro se inválida."""
+            if not isinstance(p, Forest.Position):
+                raise TypeError("p deve ser uma Position")
+            if p._container != self:
+                raise ValueError("p não pertence a esta árvore")
+            f = self._forest
+            if p._epoch != f._epoch:
+                raise ValueError("Position de antes do compact()")
+            if f._tree[p._index] != self._id:
+                raise ValueError("p já foi removido")
+            return p._index
+
+        def _make_position(self, i: int) -> Optional["Forest.Position"]:
+            return None if i < 0 else Forest.Position(self, i, self._forest._epoch)
+
+        # ---- informações básicas ----
+        def __len__(self) -> int:
+            return self._forest._sizes[self._id]
+
+        def is_empty(self) -> bool:
+            return self._forest._sizes[self._id] == 0
+
+        def root(self) -> Optional["Forest.Position"]:
+            return self._make_position(self._forest._roots[self._id])
+
+        def parent(self, p: "Forest.Position") -> Optional["Forest.Position"]:
+            return self._make_position(self._forest._parent[self._validate(p)])
+
+        def left(self, p: "Forest.Position") -> Optional["Forest.Position"]:
+            return self._make_position(self._forest._left[self._validate(p)])
+
+        def right(self, p: "Forest.Position") -> Optional["Forest.Position"]:
+            return self._make_position(self._forest._right[self._validate(p)])
+
+        def sibling(self, p: "Forest.Position") -> Optional["Forest.Position"]:
+            f = self._forest
+            i = self._validate(p)
+            pai = f._parent[i]
+            if pai < 0:
+                return None
+            return self._make_position(f._right[pai] if f._left[pai] == i else f._left[pai])
+
+        def num_children(self, p: "Forest.Position") -> int:
+            f = self._forest
+            i = self._validate(p)
+            return (f._left[i] >= 0) + (f._right[i] >= 0)
+
+        def children(self, p: "Forest.Position") -> Iterator["Forest.Position"]:
+            f = self._forest
+            i = self._validate(p)
+            if f._left[i] >= 0:
+                yield self._make_position(f._left[i])  # type: ignore
+            if f._right[i] >= 0:
+                yield self._make_position(f._right[i])  # type: ignore
+
+        def depth(self, p: "Forest.Position") -> int:
+            """Profundidade de p (raiz tem profundidade 0)."""
+            parent = self._forest._parent
+            i = self._validate(p)
+            d = 0
+            while parent[i] >= 0:
+                i = parent[i]
+                d += 1
+            return d
+
+        def height(self, p: Optional["Forest.Position"] = None) -> int:
+            """Altura da subárvore de p (ou da árvore toda). O(tamanho da subárvore)."""
+            if p is None:
+                if self.is_empty():
+                    raise ValueError("árvore vazia não tem altura")
+                i = self._forest._roots[self._id]
+            else:
+                i = self._validate(p)
+            f = self._forest
+            alt = 0
+            stack = [(i, 0)]
+            while stack:
+                i, d = stack.pop()
+                if d > alt:
+                    alt = d
+                if f._left[i] >= 0:
+                    stack.append((f._left[i], d + 1))
+                if f._right[i] >= 0:
+                    stack.append((f._right[i], d + 1))
+            return alt
+
+        def subtree_size(self, p: "Forest.Position") -> int:
+            """Número de nós na subárvore de p. O(tamanho da subárvore)."""
+            return sum(1 for _ in self._forest._preorder_indices(self._validate(p)))
+
+        # ---- modificadores ----
+        def add_root(self, e: Any) -> "Forest.Position":
+            f = self._forest
+            if f._roots[self._id] >= 0:
+                raise ValueError("raiz já existe")
+            i = f._alloc(self._id, e, _NONE)
+            f._roots[self._id] = i
+            f._sizes[self._id] = 1
+            return self._make_position(i)  # type: ignore
+
+        def add_left(self, p: "Forest.Position", e: Any) -> "Forest.Position":
+            f = self._forest
+            i = self._validate(p)
+            if f._left[i] >= 0:
+                raise ValueError("já existe filho esquerdo")
+            j = f._left[i] = f._alloc(self._id, e, i)
+            f._sizes[self._id] += 1
+            f._contiguous = False
+            return self._make_position(j)  # type: ignore
+
+        def add_right(self, p: "Forest.Position", e: Any) -> "Forest.Position":
+            f = self._forest
+            i = self._validate(p)
+            if f._right[i] >= 0:
+                raise ValueError("já existe filho direito")
+            j = f._right[i] = f._alloc(self._id, e, i)
+            f._sizes[self._id] += 1
+            f._contiguous = False
+            return self._make_position(j)  # type: ignore
+
+        def replace(self, p: "Forest.Position", e: Any) -> Any:
+            """Substitui o elemento em p por e; retorna o elemento antigo."""
+            elems = self._forest._elems
+            i = self._validate(p)
+            old = elems[i]
+            elems[i] = e
+            return old
+
+        def delete(self, p: "Forest.Position") -> Any:
+            """Remove o nó p (no máximo 1 filho). Retorna o elemento removido."""
+            f = self._forest
+            i = self._validate(p)
+            if f._left[i] >= 0 and f._right[i] >= 0:
+                raise ValueError("não pode remover nó com dois filhos")
+            child = f._left[i] if f._left[i] >= 0 else f._right[i]
+            pai = f._parent[i]
+            if child >= 0:
+                f._parent[child] = pai
+            if pai < 0:
+                f._roots[self._id] = child
+            elif f._left[pai] == i:
+                f._left[pai] = child
+            else:
+                f._right[pai] = child
+            f._sizes[self._id] -= 1
+            return f._free(i)
+
+        def clear(self) -> None:
+            """Esvazia a árvore (o handle continua valendo)."""
+            f = self._forest
+            raiz = f._roots[self._id]
+            if raiz >= 0:
+                for i in list(f._preorder_indices(raiz)):
+                    f._free(i)
+            f._roots[self._id] = _NONE
+            f._sizes[self._id] = 0
+
+        # ---- travessias ----
+        def _positions(self, indices: Iterable[int]) -> Iterator["Forest.Position"]:
+            epoch = self._forest._epoch
+            for i in indices:
+                yield Forest.Position(self, i, epoch)
+
+        def preorder(self) -> Iterator["Forest.Position"]:
+            raiz = self._forest._roots[self._id]
+            if raiz >= 0:
+                yield from self._positions(self._forest._preorder_indices(raiz))
+
+        def postorder(self) -> Iterator["Forest.Position"]:
+            f = self._forest
+            raiz = f._roots[self._id]
+            if raiz < 0:
+                return
+            # pré-ordem espelhada (raiz, direita, esquerda) ao contrário
+            ordem = []
+            stack = [raiz]
+            while stack:
+                i = stack.pop()
+                ordem.append(i)
+                if f._left[i] >= 0:
+                    stack.append(f._left[i])
+                if f._right[i] >= 0:
+                    stack.append(f._right[i])
+            yield from self._positions(reversed(ordem))
+
+        def inorder(self) -> Iterator["Forest.Position"]:
+            f = self._forest
+            epoch = f._epoch
+            i = f._roots[self._id]
+            stack: List[int] = []
+            while stack or i >= 0:
+                while i >= 0:
+                    stack.append(i)
+                    i = f._left[i]
+                i = stack.pop()
+                yield Forest.Position(self, i, epoch)
+                i = f._right[i]
+
+        def breadthfirst(self) -> Iterator["Forest.Position"]:
+            f = self._forest
+            raiz = f._roots[self._id]
+            if raiz < 0:
+                return
+            epoch = f._epoch
+            fringe = deque([raiz])
+            while fringe:
+                i = fringe.popleft()
+                yield Forest.Position(self, i, epoch)
+                if f._left[i] >= 0:
+                    fringe.append(f._left[i])
+                if f._right[i] >= 0:
+                    fringe.append(f._right[i])
+
+        def __iter__(self) -> Iterator[Any]:
+            """Elementos em inorder, como no LinkedBinaryTree."""
+            elems = self._forest._elems
+            for p in self.inorder():
+                yield elems[p._index]
+
+        def __str__(self) -> str:
+            if self.is_empty():
+                return f"Forest.Tree#{self._id}()"
+            return f"Forest.Tree#{self._id}(inorder: [" + ", ".join(repr(e) for e in self) + "])"
+
+        __repr__ = __str__
+
+    # ---------------- construtor ----------------
+    def __init__(self, typecode: Optional[str] = None):
+        """Floresta vazia.
+
+        typecode (por exemplo "d" ou "q") guarda os elementos num array tipado
+        em vez de numa lista; aí todos precisam ser números daquele tipo.
+        """
+        self._typecode = typecode
+        self._elems: Any = array(typecode) if typecode else []
+        self._parent = array("i")
+        self._left = array("i")
+        self._right = array("i")
+        self._tree = array("i")
+        # por árvore: índice da raiz e quantidade de nós
+        self._roots = array("i")
+        self._sizes = array("i")
+        self._dead = 0            # nós removidos ainda ocupando o arena
+        self._epoch = 0           # muda a cada compact (os índices mudam)
+        # True enquanto cada árvore estiver contígua e em pré-ordem no arena
+        self._contiguous = True
+
+    # ---------------- internos do arena ----------------
+    def _alloc(self, tree_id: int, e: Any, parent: int) -> int:
+        i = len(self._tree)
+        self._elems.append(e)
+        self._parent.append(parent)
+        self._left.append(_NONE)
+        self._right.append(_NONE)
+        self._tree.append(tree_id)
+        if tree_id != len(self._roots) - 1:
+            self._contiguous = False   # nó de uma árvore que não é a última
+        return i
+
+    def _free(self, i: int) -> Any:
+        e = self._elems[i]
+        if not self._typecode:
+            self._elems[i] = None     # não segura o elemento removido
+        self._tree[i] = _NONE
+        self._dead += 1
+        self._contiguous = False
+        return e
+
+    def _preorder_indices(self, i: int) -> Iterator[int]:
+        left, right = self._left, self._right
+        stack = [i]
+        while stack:
+            i = stack.pop()
+            yield i
+            if right[i] >= 0:
+                stack.append(right[i])
+            if left[i] >= 0:
+                stack.append(left[i])
+
+    def _new_tree_id(self) -> int:
+        self._roots.append(_NONE)
+        self._sizes.append(0)
+        return len(self._roots) - 1
+
+    # ---------------- árvores ----------------
+    def __len__(self) -> int:
+        """Quantidade de árvores (inclusive as vazias)."""
+        return len(self._roots)
+
+    def __getitem__(self, t: int) -> "Forest.Tree":
+        if not -len(self._roots) <= t < len(self._roots):
+            raise IndexError("árvore fora do intervalo")
+        return Forest.Tree(self, t % len(self._roots))
+
+    def __iter__(self) -> Iterator["Forest.Tree"]:
+        for t in range(len(self._roots)):
+            yield Forest.Tree(self, t)
+
+    def num_nodes(self) -> int:
+        """Nós vivos em todas as árvores."""
+        return len(self._tree) - self._dead
+
+    def new_tree(self) -> "Forest.Tree":
+        """Árvore vazia nova; preencha com add_root/add_left/add_right."""
+        return Forest.Tree(self, self._new_tree_id())
+
+    def append(self, arvore: Any) -> "Forest.Tree":
+        """Copia uma árvore com a API de Position (ex.: LinkedBinaryTree) para o arena."""
+        t = self._new_tree_id()
+        if len(arvore) > 0:
+            # pré-ordem iterativa, como empacotar_arvores (Exercicio5.py)
+            pilha = [(arvore.root(), _NONE, 0)]    # (posição, índice do pai, lado)
+            while pilha:
+                no, pai, lado = pilha.pop()
+                i = self._alloc(t, no.element(), pai)
+                if pai < 0:
+                    self._roots[t] = i
+                else:
+                    (self._left if lado == 0 else self._right)[pai] = i
+                filho_dir = arvore.right(no)
+                if filho_dir is not None:
+                    pilha.append((filho_dir, i, 1))
+                filho_esq = arvore.left(no)
+                if filho_esq is not None:
+                    pilha.append((filho_esq, i, 0))
+            self._sizes[t] = len(arvore)
+        return Forest.Tree(self, t)
+
+    def extend(self, arvores: Iterable[Any]) -> List["Forest.Tree"]:
+        """append para várias árvores; devolve os handles na mesma ordem."""
+        return [self.append(a) for a in arvores]
+
+    def append_packed(self, valores: Sequence[Any], esq: Sequence[int], dir: Sequence[int],
+                      inicio: Sequence[int]) -> List["Forest.Tree"]:
+        """Acrescenta árvores já empacotadas (formato de empacotar_arvores no Exercicio5.py).
+
+        A árvore k ocupa valores[inicio[k]:inicio[k + 1]] em pré-ordem; esq/dir
+        são índices nesses arrays (ou -1). Tudo é conferido antes (cada nó
+        com um pai só e alcançável da raiz da sua árvore, sem ciclos) e
+        depois copiado de uma vez.
+        """
+        base = len(self._tree)
+        n = len(valores)
+        if (len(esq) != n or len(dir) != n or len(inicio) < (2 if n else 0)
+                or (len(inicio) and (inicio[0] != 0 or inicio[-1] != n))):
+            raise ValueError("arrays empacotados com tamanhos incoerentes")
+        pai = [_NONE] * n
+        limites = []
+        for k in range(len(inicio) - 1):
+            lo, hi = int(inicio[k]), int(inicio[k + 1])
+            if hi < lo:
+                raise ValueError(f"inicio precisa ser crescente (árvore {k})")
+            for i in range(lo, hi):
+                for c in (int(esq[i]), int(dir[i])):
+                    if c >= 0:
+                        if not lo < c < hi or pai[c] != _NONE:
+                            raise ValueError(f"filho inválido {c} no nó {i}")
+                        pai[c] = base + i
+            if hi > lo:
+                # com um pai por nó, alcançar todos a partir da raiz descarta ciclos
+                alcancados = 0
+                pilha = [lo]
+                while pilha:
+                    i = pilha.pop()
+                    alcancados += 1
+                    for c in (int(esq[i]), int(dir[i])):
+                        if c >= 0:
+                            pilha.append(c)
+                if alcancados != hi - lo:
+                    raise ValueError(f"árvore {k}: {hi - lo - alcancados} nós fora da árvore (ciclo ou sem pai)")
+            limites.append((lo, hi))
+        dono = [0] * n
+        handles = []
+        for lo, hi in limites:
+            t = self._new_tree_id()
+            for i in range(lo, hi):
+                dono[i] = t
+            if hi > lo:
+                self._roots[t] = base + lo
+                self._sizes[t] = hi - lo
+            handles.append(Forest.Tree(self, t))
+        self._elems.extend(v.item() if hasattr(v, "item") else v for v in valores)
+        self._parent.extend(pai)
+        self._left.extend(int(c) + base if c >= 0 else _NONE for c in esq)
+        self._right.extend(int(c) + base if c >= 0 else _NONE for c in dir)
+        self._tree.extend(dono)
+        return handles
+
+    # ---------------- arena inteiro ----------------
+    def compact(self) -> int:
+        """Reescreve o arena sem buracos, cada árvore contígua em pré-ordem.
+
+        Os handles continuam valendo; as Positions antigas não. Retorna quantos
+        nós removidos foram descartados.
+        """
+        liberados = self._dead
+        if self._contiguous and not liberados:
+            return 0
+        velho = array("i", [_NONE]) * len(self._tree)   # índice antigo -> novo
+        ordem: List[int] = []
+        for t in range(len(self._roots)):
+            raiz = self._roots[t]
+            if raiz >= 0:
+                for i in self._preorder_indices(raiz):
+                    velho[i] = len(ordem)
+                    ordem.append(i)
+        elems = array(self._typecode) if self._typecode else []
+        elems.extend(self._elems[i] for i in ordem)
+
+        def remapeia(links: array) -> array:
+            return array("i", (velho[links[i]] if links[i] >= 0 else _NONE for i in ordem))
+
+        self._parent, self._left, self._right = (
+            remapeia(self._parent), remapeia(self._left), remapeia(self._right))
+        self._tree = array("i", (self._tree[i] for i in ordem))
+        self._elems = elems
+        self._roots = array("i", (velho[r] if r >= 0 else _NONE for r in self._roots))
+        self._dead = 0
+        self._contiguous = True
+        self._epoch += 1
+        return liberados
+
+    def arena(self) -> Tuple[Any, array, array, array, array]:
+        """(elementos, pai, esq, dir, arvore) do arena, sem cópia.
+
+        Servem para percorrer todos os nós de uma vez; nós removidos têm
+        arvore[i] == -1. Não devem ser alterados por fora.
+        """
+        return self._elems, self._parent, self._left, self._right, self._tree
+
+    def empacotar(self) -> Tuple[Any, Any, Any, Any]:
+        """(valores, esq, dir, inicio) como arrays NumPy, no formato de Exercicio5.py.
+
+        Compacta antes se precisar. Os arrays são cópias: uma view NumPy
+        direta no arena travaria os arrays tipados (não poderiam mais crescer).
+        """
+        if np is None:
+            raise ImportError("empacotar precisa do numpy")
+        self.compact()
+        inicio = np.zeros(len(self._sizes) + 1, dtype=np.int64)
+        np.cumsum(np.frombuffer(self._sizes, dtype=np.int32), out=inicio[1:])
+        valores = np.frombuffer(self._elems, dtype=self._elems.typecode).copy() if self._typecode \
+            else np.asarray(self._elems)
+        return (valores, np.frombuffer(self._left, dtype=np.int32).copy(),
+                np.frombuffer(self._right, dtype=np.int32).copy(), inicio)
+
+    def nbytes(self) -> int:
+        """Bytes dos arrays do arena (sem contar elementos que são objetos)."""
+        total = sum(a.buffer_info()[1] * a.itemsize for a in
+                    (self._parent, self._left, self._right, self._tree, self._roots, self._sizes))
+        if self._typecode:
+            total += self._elems.buffer_info()[1] * self._elems.itemsize
+        else:
+            total += len(self._elems) * 8   # uma referência por nó
+        return total
+
+
+# ---------------- exemplo rápido de uso ----------------
+if __name__ == "__main__":
+    import random
+    import tracemalloc
+
+    from linkedBinaryTree import LinkedBinaryTree
+
+    def arvore_aleatoria(n: int) -> LinkedBinaryTree:
+        T = LinkedBinaryTree()
+        livres = [T.add_root(random.randint(1, 9))]
+        for _ in range(n - 1):
+            p = livres[random.randrange(len(livres))]
+            if T.left(p) is None:
+                livres.append(T.add_left(p, random.randint(1, 9)))
+            else:
+                livres.append(T.add_right(p, random.randint(1, 9)))
+                livres.remove(p)
+        return T
+
+    random.seed(1)
+    modelos = [arvore_aleatoria(random.randint(5, 50)) for _ in range(200)]
+
+    F = Forest(typecode="q")
+    arvores = F.extend(modelos)
+    t0 = arvores[0]
+    print("árvore 0:", t0, "| altura", t0.height(), "| pré-ordem:", [p.element() for p in t0.preorder()][:8], "...")
+    print("mesma resposta do LinkedBinaryTree:", list(t0) == list(modelos[0]))
+
+    # handle no lugar da árvore: muda e remove nós como no linkedBinaryTree.py
+    r = t0.root()
+    folha = next(p for p in t0.postorder() if t0.num_children(p) == 0)
+    t0.delete(folha)
+    t0.replace(r, 100)
+    print("depois de delete + replace:", len(t0), "nós, raiz", t0.root().element())
+    print("compact() descartou", F.compact(), "nó(s)")
+
+    # algoritmo em lote sobre o arena inteiro: soma de cada árvore
+    if np is not None:
+        valores, esq, dir, inicio = F.empacotar()
+        somas = np.add.reduceat(valores, inicio[:-1])
+        print("somas das 5 primeiras árvores (em lote):", somas[:5].tolist(),
+              "| conferindo:", [sum(t) for t in arvores[:5]])
+    else:
+        print("(numpy não instalado: empacotar indisponível)")
+
+    # memória: floresta x uma LinkedBinaryTree por árvore (elementos None)
+    n_arvores = 20_000
+    tracemalloc.start()
+    a0, _ = tracemalloc.get_traced_memory()
+    soltas = []
+    for _ in range(n_arvores):
+        T = LinkedBinaryTree()
+        r = T.add_root(None)
+        T.add_left(r, None)
+        T.add_right(r, None)
+        soltas.append(T)
+    a1, _ = tracemalloc.get_traced_memory()
+    G = Forest()
+    for _ in range(n_arvores):
+        t = G.new_tree()
+        r = t.add_root(None)
+        t.add_left(r, None)
+        t.add_right(r, None)
+    a2, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"\n{n_arvores} árvores de 3 nós: LinkedBinaryTree {(a1 - a0) / n_arvores:.0f} B/árvore,"
+          f" Forest {(a2 - a1) / n_arvores:.0f} B/árvore")
@@ -0,0 +1,395 @@
+"""Leitura e escrita de LinkedBinaryTree em JSON, em streaming e sem recursão.
+
+Dois formatos:
+
+- aninhado: {"value": v, "left": {...} | null, "right": {...} | null}
+- plano: [[v, esq, dir], ...], um registro por nó; esq/dir são índices de
+  outros registros (ou null) e os pais vêm antes dos filhos (dump_flat
+  grava em pré-ordem, com a raiz no índice 0)
+
+O leitor consome o arquivo em pedaços (chunk_size caracteres) com um
+tokenizador próprio e uma pilha explícita, então a memória fica limitada
+pela profundidade da árvore (e pelo maior valor), nunca pelo arquivo todo.
+"""
+
+import json
+import re
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+from linkedBinaryTree import LinkedBinaryTree
+
+_NUMERO = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_ESCALAR = re.compile(r"[-+.0-9A-Za-z]*")
+_LITERAIS = {"true": True, "false": False, "null": None}
+
+
+class _Tokens:
+    """Tokenizador JSON incremental: lê de fp só o necessário."""
+
+    def __init__(self, fp: IO[str], chunk_size: int = 1 << 16):
+        self._fp = fp
+        self._chunk = chunk_size
+        self._buf = ""
+        self._i = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Traz mais um pedaço do arquivo; False se já acabou."""
+        if self._eof:
+            return False
+        data = self._fp.read(self._chunk)
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._i:] + data
+        self._i = 0
+        return True
+
+    def _skip_ws(self) -> bool:
+        while True:
+            buf, i = self._buf, self._i
+            n = len(buf)
+            while i < n and buf[i] in " \t\r\n":
+                i += 1
+            self._i = i
+            if i < n:
+                return True
+            if not self._fill():
+                return False
+
+    def next(self) -> Tuple[str, Any]:
+        """Próximo token como (tipo, valor); tipo é '{', '}', '[', ']', ':', ',', 'value' ou 'eof'."""
+        if not self._skip_ws():
+            return ("eof", None)
+        c = self._buf[self._i]
+        if c in "{}[]:,":
+            self._i += 1
+            return (c, None)
+        if c == '"':
+            return ("value", self._string())
+        return ("value", self._scalar())
+
+    def _string(self) -> str:
+        j = self._i + 1
+        while True:
+            k = self._buf.find('"', j)
+            if k < 0:
+                lido = len(self._buf) - self._i   # já procurado até aqui
+                if not self._fill():
+                    raise ValueError("JSON inválido: string sem fim")
+                j = self._i + lido
+                continue
+            # aspas escapadas têm um número ímpar de barras antes
+            barras = 0
+            while self._buf[k - 1 - barras] == "\\":
+                barras += 1
+            if barras % 2 == 0:
+                raw = self._buf[self._i:k + 1]
+                self._i = k + 1
+                return json.loads(raw)
+            j = k + 1
+
+    def _scalar(self) -> Any:
+        while True:
+            m = _ESCALAR.match(self._buf, self._i)
+            # o token pode continuar no próximo pedaço
+            if m.end() == len(self._buf) and self._fill():
+                continue
+            texto = m.group()
+            self._i = m.end()
+            if texto in _LITERAIS:
+                return _LITERAIS[texto]
+            if not _NUMERO.fullmatch(texto):
+                raise ValueError(f"JSON inválido perto de {self._buf[self._i - len(texto):self._i + 20]!r}")
+            return json.loads(texto)
+
+    def expect(self, tipo: str) -> Any:
+        t, v = self.next()
+        if t != tipo:
+            raise ValueError(f"JSON inválido: esperava {tipo!r}, veio {t!r}")
+        return v
+
+
+def _read_value(tokens: _Tokens, first: Optional[Tuple[str, Any]] = None) -> Any:
+    """Lê um valor JSON qualquer (objetos e listas com pilha explícita)."""
+    t, v = first if first is not None else tokens.next()
+    if t == "value":
+        return v
+    if t not in ("{", "["):
+        raise ValueError(f"JSON inválido: token {t!r} inesperado")
+    raiz: Any = {} if t == "{" else []
+    stack: List[Any] = [raiz]
+    # "inicio": contêiner recém-aberto (fecha ou vem o 1º item);
+    # "item": depois de ","; "fim": depois de um item (vem "," ou fecha)
+    estado = "inicio"
+    while stack:
+        cont = stack[-1]
+        fecha = "}" if isinstance(cont, dict) else "]"
+        t, v = tokens.next()
+        if t == "eof":
+            raise ValueError("JSON inválido: fim inesperado")
+        if estado != "item" and t == fecha:
+            stack.pop()
+            estado = "fim"
+            continue
+        if estado == "fim":
+            if t != ",":
+                raise ValueError(f"JSON inválido: esperava ',' ou {fecha!r}, veio {t!r}")
+            estado = "item"
+            continue
+        if isinstance(cont, dict):
+            if t != "value" or not isinstance(v, str):
+                raise ValueError("JSON inválido: chave de objeto deve ser string")
+            tokens.expect(":")
+            chave = v
+            t, v = tokens.next()
+        if t == "value":
+            novo = v
+        elif t in ("{", "["):
+            novo = {} if t == "{" else []
+        else:
+            raise ValueError(f"JSON inválido: token {t!r} inesperado")
+        if isinstance(cont, dict):
+            cont[chave] = novo
+        else:
+            cont.append(novo)
+        if t in ("{", "["):
+            stack.append(novo)
+            estado = "inicio"
+        else:
+            estado = "fim"
+    return raiz
+
+
+# ---------------- formato aninhado ----------------
+def load(fp: IO[str], chunk_size: int = 1 << 16) -> LinkedBinaryTree:
+    """Monta a árvore a partir do JSON aninhado {value, left, right} em fp.
+
+    Os nós são ligados pelo caminho rápido em lote (_add_*) e tamanho e
+    altura saem numa passada só no fim: O(n) mesmo numa árvore bem funda.
+    """
+    tokens = _Tokens(fp, chunk_size)
+    T = LinkedBinaryTree()
+    t, v = tokens.next()
+    if t == "value" and v is None:      # null: árvore vazia
+        if tokens.next()[0] != "eof":
+            raise ValueError("JSON inválido: sobrou conteúdo depois da árvore")
+        return T
+    if t != "{":
+        raise ValueError("JSON inválido: a árvore deve ser um objeto ou null")
+    T._begin_bulk()
+    stack = [T._add_root(None)]
+    estado = "inicio"       # como em _read_value
+    while stack:
+        t, v = tokens.next()
+        if estado != "item" and t == "}":
+            stack.pop()
+            estado = "fim"
+            continue
+        if estado == "fim":
+            if t != ",":
+                raise ValueError(f"JSON inválido: esperava ',' ou '}}', veio {t!r}")
+            estado = "item"
+            continue
+        if t != "value" or not isinstance(v, str):
+            raise ValueError(f"JSON inválido: esperava uma chave, veio {t!r}")
+        tokens.expect(":")
+        estado = "fim"
+        if v == "value":
+            stack[-1].element = _read_value(tokens)
+        elif v in ("left", "right"):
+            t2, v2 = tokens.next()
+            if t2 == "value" and v2 is None:
+                continue
+            if t2 != "{":
+                raise ValueError(f"JSON inválido: {v!r} deve ser um objeto ou null")
+            no = stack[-1]
+            if (no.left if v == "left" else no.right) is not None:
+                raise ValueError(f"JSON inválido: chave {v!r} repetida")
+            stack.append(T._add_left(no, None) if v == "left" else T._add_right(no, None))
+            estado = "inicio"
+        else:
+            _read_value(tokens)   # chave desconhecida: ignora
+    if tokens.next()[0] != "eof":
+        raise ValueError("JSON inválido: sobrou conteúdo depois da árvore")
+    T._finish_bulk()
+    return T
+
+
+def dump(T: LinkedBinaryTree, fp: IO[str], buffer_size: int = 1 << 16) -> None:
+    """Grava T em fp no formato aninhado, sem montar o dicionário inteiro.
+
+    NaN e infinito não são JSON válido: geram ValueError (load não os lê).
+    """
+    if T.is_empty():
+        fp.write("null")
+        return
+    partes: List[str] = []
+    tam = 0
+    # pilha com Positions (a escrever) e pedaços de texto prontos
+    stack: List[Any] = [T.root()]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            texto = item
+        else:
+            texto = '{"value": ' + json.dumps(item.element(), allow_nan=False) + ', "left": '
+            esq, dir = T.left(item), T.right(item)
+            stack.append("}")
+            stack.append(dir if dir is not None else "null")
+            stack.append(', "right": ')
+            stack.append(esq if esq is not None else "null")
+        partes.append(texto)
+        tam += len(texto)
+        if tam >= buffer_size:
+            fp.write("".join(partes))
+            partes.clear()
+            tam = 0
+    fp.write("".join(partes))
+
+
+# ---------------- formato plano ----------------
+def _tamanhos(raiz: Any) -> Dict[Any, int]:
+    """Tamanho de cada subárvore (pós-ordem iterativa), para nós que não o guardam."""
+    tam: Dict[Any, int] = {}
+    stack = [(raiz, False)] if raiz is not None else []
+    while stack:
+        n, filhos_prontos = stack.pop()
+        if not filhos_prontos:
+            stack.append((n, True))
+            for filho in (n.left, n.right):
+                if filho is not None:
+                    stack.append((filho, False))
+            continue
+        tam[n] = 1 + tam.get(n.left, 0) + tam.get(n.right, 0)
+    return tam
+
+
+def dump_flat(T: LinkedBinaryTree, fp: IO[str], buffer_size: int = 1 << 16) -> None:
+    """Grava [[valor, esq, dir], ...] em pré-ordem (a raiz é o registro 0).
+
+    O índice do filho direito sai do tamanho da subárvore esquerda, que
+    cada nó já guarda, então nada precisa ser montado antes (numa árvore
+    compacta os tamanhos são calculados numa pós-ordem antes de gravar).
+    Como em dump, NaN e infinito geram ValueError.
+    """
+    tamanhos = _tamanhos(T._root) if T._compact else None
+    partes: List[str] = ["["]
+    tam = 0
+    i = 0
+    stack = [T._root] if T._root is not None else []
+    while stack:
+        n = stack.pop()
+        esq, dir = n.left, n.right
+        i_esq = i + 1 if esq is not None else None
+        if dir is None:
+            i_dir = None
+        elif esq is None:
+            i_dir = i + 1
+        else:
+            i_dir = i + 1 + (tamanhos[esq] if tamanhos is not None else esq.size)
+        texto = ("," if i else "") + json.dumps([n.element, i_esq, i_dir], allow_nan=False)
+        partes.append(texto)
+        tam += len(texto)
+        if tam >= buffer_size:
+            fp.write("".join(partes))
+            partes.clear()
+            tam = 0
+        i += 1
+        if dir is not None:
+            stack.append(dir)
+        if esq is not None:
+            stack.append(esq)
+    partes.append("]")
+    fp.write("".join(partes))
+
+
+def load_flat(fp: IO[str], chunk_size: int = 1 << 16) -> LinkedBinaryTree:
+    """Monta a árvore a partir de [[valor, esq, dir], ...] (pais antes dos filhos).
+
+    Só os filhos anunciados e ainda não lidos ficam guardados; em pré-ordem
+    isso é O(profundidade).
+    """
+    tokens = _Tokens(fp, chunk_size)
+    T = LinkedBinaryTree()
+    T._begin_bulk()
+    tokens.expect("[")
+    pendentes: Dict[int, Tuple[Any, str]] = {}   # índice do filho -> (nó do pai, lado)
+    i = 0
+    estado = "inicio"       # como em _read_value
+    while True:
+        t, _ = tokens.next()
+        if estado != "item" and t == "]":
+            break
+        if estado == "fim":
+            if t != ",":
+                raise ValueError(f"JSON inválido: esperava ',' ou ']', veio {t!r}")
+            estado = "item"
+            continue
+        if t != "[":
+            raise ValueError("JSON inválido: cada nó deve ser uma lista [valor, esq, dir]")
+        valor = _read_value(tokens)
+        tokens.expect(",")
+        i_esq = tokens.expect("value")
+        tokens.expect(",")
+        i_dir = tokens.expect("value")
+        tokens.expect("]")
+        # os índices já foram conferidos abaixo: dá para usar o caminho rápido
+        # (_add_* em lote; altura e tamanho saem todos no _finish_bulk)
+        if i == 0:
+            p = T._add_root(valor)
+        else:
+            if i not in pendentes:
+                raise ValueError(f"registro {i} sem pai (os pais precisam vir antes dos filhos)")
+            pai, lado = pendentes.pop(i)
+            p = T._add_left(pai, valor) if lado == "L" else T._add_right(pai, valor)
+        for filho, lado in ((i_esq, "L"), (i_dir, "R")):
+            if filho is not None:
+                if not isinstance(filho, int) or filho <= i or filho in pendentes:
+                    raise ValueError(f"registro {i}: índice de filho inválido {filho!r}")
+                pendentes[filho] = (p, lado)
+        i += 1
+        estado = "fim"
+    if pendentes:
+        raise ValueError(f"filhos anunciados e não encontrados: {sorted(pendentes)[:5]}")
+    if tokens.next()[0] != "eof":
+        raise ValueError("JSON inválido: sobrou conteúdo depois da lista")
+    T._finish_bulk()
+    return T
+
+
+# ---------------- exemplo rápido de uso ----------------
+if __name__ == "__main__":
+    import io
+
+    T = LinkedBinaryTree()
+    r = T.add_root("raiz")
+    a = T.add_left(r, {"id": 1, "tags": ["x", "y"]})
+    T.add_right(r, 3.5)
+    T.add_left(a, None)
+    T.add_right(a, 'com "aspas"')
+
+    buf = io.StringIO()
+    dump(T, buf)
+    print("aninhado:", buf.getvalue())
+    buf.seek(0)
+    print("lido de volta:", load(buf, chunk_size=7))
+
+    buf = io.StringIO()
+    dump_flat(T, buf)
+    print("\nplano:", buf.getvalue())
+    buf.seek(0)
+    print("lido de volta:", load_flat(buf, chunk_size=5))
+
+    # uma lista de 20 mil nós: a versão recursiva estouraria a pilha
+    L = LinkedBinaryTree()
+    L._begin_bulk()
+    p = L._add_root(0)
+    for k in range(1, 20_000):
+        p = L._add_right(p, k)
+    L._finish_bulk()
+    buf = io.StringIO()
+    dump(L, buf)
+    buf.seek(0)
+    L2 = load(buf)
+    print("\nárvore com altura", L2.height(), "lida sem recursão:", len(L2), "nós")
@@ -0,0 +1,891 @@
+"""LinkedBinaryTree usada por todos os exercícios (1 a 8) e pelos outros módulos.
+
+Duas portas de entrada para modificar a árvore:
+
+- API de Position (add_root, add_left, add_right, replace, delete, ...):
+  cada chamada confere a Position com _validate e devolve uma Position nova;
+- caminho rápido (_add_root, _add_left, _add_right): recebe e devolve os
+  nós internos, sem conferência e sem criar Position. É para montar árvores
+  a partir de dados confiáveis (leitores de arquivo, apply_diff, os
+  exemplos dos exercícios). Quem chama garante que o nó é desta árvore e
+  que o lado está livre. Cada chamada ainda acerta tamanho, altura e
+  versão até a raiz; entre _begin_bulk() e _finish_bulk() isso fica para
+  uma passada só no fim, e montar n nós custa O(n).
+
+compact=True troca os nós por outros só com elemento e filhos (sem pai e
+sem estatísticas): gasta bem menos memória, mas parent, depth, height,
+subtree_size, delete, attach e detach deixam de funcionar.
+"""
+
+from typing import Any, AsyncIterator, Optional, Iterator, List
+from collections import deque
+import asyncio
+import copy
+import itertools
+
+from memoria import uso_de_memoria
+
+# carimbos de versão: um contador só para todas as árvores, assim um nó que
+# muda de árvore (detach/attach) nunca repete um carimbo já visto
+_carimbos = itertools.count(1)
+
+_CAMPOS_BASE = {'element', 'parent', 'left', 'right', 'height', 'size', 'gen', 'version'}
+
+
+def _campos_extras(cls: type) -> List[str]:
+    """Campos de __slots__ que uma subclasse de nó acrescenta aos do _Node."""
+    campos: List[str] = []
+    for k in reversed(cls.__mro__):
+        slots = k.__dict__.get('__slots__', ())
+        for c in ((slots,) if isinstance(slots, str) else slots):
+            if c not in _CAMPOS_BASE and c not in campos:
+                campos.append(c)
+    return campos
+
+
+class LinkedBinaryTree:
+    """Implementação de uma árvore binária.
+    """
+
+    # ---------------- nested Position class ----------------
+    class Position:
+        """Abstração para a posição de um elemento dentro da árvore."""
+        __slots__ = '_container', '_node', '_epoch', '_gen'
+
+        def __init__(self, container: 'LinkedBinaryTree', node: 'LinkedBinaryTree._Node', epoch: int = 0):
+            self._container = container
+            self._node = node
+            self._epoch = epoch  # época da árvore quando a Position foi conferida
+            self._gen = node.gen if node is not None else 0
+
+        def element(self) -> Any:
+            if self._gen != self._node.gen:
+                # o nó foi reaproveitado pelo pool para outro elemento
+                raise ValueError("p já foi removido")
+            return self._node.element
+
+        def __eq__(self, other: object) -> bool:
+            if not isinstance(other, LinkedBinaryTree.Position):
+                return False
+            return (other._node is self._node and other._container is self._container
+                    and other._gen == self._gen)
+
+        def __ne__(self, other: object) -> bool:
+            return not (self == other)
+
+        def __repr__(self) -> str:
+            return f"Position({self._node.element!r})"
+
+    # ---------------- internal Node class ----------------
+    class _Node:
+        __slots__ = 'element', 'parent', 'left', 'right', 'height', 'size', 'gen', 'version'
+        def __init__(self, element: Any, parent: Optional['LinkedBinaryTree._Node'] = None,
+                     left: Optional['LinkedBinaryTree._Node'] = None,
+                     right: Optional['LinkedBinaryTree._Node'] = None):
+            self.element = element
+            self.parent = parent
+            self.left = left
+            self.right = right
+            # altura e tamanho da subárvore deste nó (mantidos incrementalmente)
+            self.height = 0
+            self.size = 1
+            # geração: muda quando o nó é reaproveitado pelo pool
+            self.gen = 0
+            # carimbo da última mudança dentro da subárvore deste nó
+            self.version = 0
+
+    class _CompactNode:
+        # nó de compact=True: só elemento e filhos. parent e gen ficam fixos
+        # na classe (sem custo por nó) para _validate e Position funcionarem
+        __slots__ = 'element', 'left', 'right'
+        parent = None
+        gen = 0
+
+        def __init__(self, element: Any, parent: Optional['LinkedBinaryTree._Node'] = None):
+            self.element = element
+            self.left = None
+            self.right = None
+
+    # ---------------- constructor ----------------
+    def __init__(self, clear_on_delete: bool = False, pool_size: int = 0, compact: bool = False,
+                 subtree_versions: bool = False):
+        """Cria árvore vazia.
+
+        clear_on_delete=True solta elemento e filhos do nó removido por delete
+        (uma Position velha não segura mais nada vivo). pool_size > 0 guarda
+        até pool_size nós removidos para reaproveitar nos próximos add_*
+        (implica clear_on_delete). compact=True usa nós sem pai e sem
+        estatísticas (ver a descrição do módulo). subtree_versions=True
+        liga version(p) por subárvore; o preço é replace subir até a raiz
+        (O(profundidade) em vez de O(1)).
+        """
+        if compact and subtree_versions:
+            raise ValueError("árvore compacta não guarda versão por subárvore")
+        self._compact = compact
+        self._subtree_versions = subtree_versions
+        self._node_cls = self._CompactNode if compact else self._Node
+        # entre _begin_bulk e _finish_bulk os _add_* não sobem até a raiz
+        self._bulk = False
+        self._root: Optional[LinkedBinaryTree._Node] = None
+        self._size: int = 0
+        # _epoch muda sempre que uma subárvore inteira sai da árvore
+        # (prune/detach/attach); Positions de épocas antigas são reconferidas
+        self._epoch: int = 0
+        # _version muda a cada add_*/replace/delete/attach/detach
+        self._version: int = 0
+        # _shape muda só quando a forma muda (add_*/delete/attach/detach,
+        # não replace); quem guarda índices por nó compara com ele
+        self._shape: int = 0
+        self._clear_on_delete = clear_on_delete or pool_size > 0
+        self._pool_size = pool_size
+        self._pool: List[LinkedBinaryTree._Node] = []
+        self._pool_stats = {"hits": 0, "misses": 0, "recycled": 0, "cleared": 0}
+
+    # ---------------- utilitários internos ----------------
+    def _validate(self, p: 'LinkedBinaryTree.Position') -> 'LinkedBinaryTree._Node':
+        """Transforma uma Position em nó interno; levanta erro se inválido."""
+        if not isinstance(p, LinkedBinaryTree.Position):
+            raise TypeError("p deve ser uma Position válido")
+        if p._container is not self:
+            raise ValueError("p não pertence a esta árvore")
+        if p._node.parent is p._node or p._gen != p._node.gen:   # desativado ou reaproveitado
+            raise ValueError("p já foi removido")
+        if p._epoch != self._epoch:
+            self._revalidate(p)
+        return p._node
+
+    def _revalidate(self, p: 'LinkedBinaryTree.Position') -> None:
+        """Confere uma Position de época antiga subindo até a raiz.
+
+        Só roda uma vez por Position depois de cada prune/detach: se o nó
+        ainda chega em self._root, a Position é atualizada para a época atual.
+        """
+        node = p._node
+        while node.parent is not None:
+            node = node.parent
+        if node is not self._root:
+            raise ValueError("p já foi removido")
+        p._epoch = self._epoch
+
+    def _make_position(self, node: Optional['_Node']) -> Optional['Position']:
+        """Retorna Position para nó (ou None)."""
+        return None if node is None else LinkedBinaryTree.Position(self, node, self._epoch)
+
+    def _new_node(self, e: Any, parent: Optional['_Node'] = None) -> '_Node':
+        """Nó novo, vindo do pool quando houver algum disponível."""
+        if self._pool:
+            node = self._pool.pop()
+            self._pool_stats["hits"] += 1
+            node.element = e
+            node.parent = parent
+            node.height = 0
+            node.size = 1
+            node.version = next(_carimbos)
+            return node
+        if self._pool_size:
+            self._pool_stats["misses"] += 1
+        return self._node_cls(e, parent=parent)
+
+    def _release(self, node: '_Node') -> None:
+        """Nó removido por delete: limpa as referências e, se couber, vai para o pool."""
+        if self._clear_on_delete:
+            node.element = None
+            node.left = node.right = None
+            self._pool_stats["cleared"] += 1
+        if len(self._pool) < self._pool_size:
+            node.gen += 1        # Positions antigas deste nó não valem mais
+            self._pool.append(node)
+            self._pool_stats["recycled"] += 1
+
+    def pool_stats(self) -> dict:
+        """Contadores do pool: hits, misses, recycled, cleared e quantos nós estão guardados."""
+        stats = dict(self._pool_stats)
+        stats["pooled"] = len(self._pool)
+        return stats
+
+    def _refresh(self, node: '_Node') -> None:
+        """Recalcula altura e tamanho de node a partir dos filhos."""
+        hl, sl = (node.left.height, node.left.size) if node.left is not None else (-1, 0)
+        hr, sr = (node.right.height, node.right.size) if node.right is not None else (-1, 0)
+        node.height = 1 + (hl if hl > hr else hr)
+        node.size = 1 + sl + sr
+
+    def _fix_upward(self, node: Optional['_Node'], delta: int) -> None:
+        """Atualiza tamanho (+delta), altura e versão de node e de todos os ancestrais."""
+        v = self._nova_versao()
+        if delta:
+            self._shape += 1
+        if self._compact:
+            return      # nós compactos só têm a versão da árvore
+        while node is not None:
+            node.version = v
+            node.size += delta
+            hl = node.left.height if node.left is not None else -1
+            hr = node.right.height if node.right is not None else -1
+            node.height = 1 + (hl if hl > hr else hr)
+            node = node.parent
+
+    def _nova_versao(self) -> int:
+        """Troca a versão da árvore por um carimbo novo e o devolve
+        (para subclasses que mexem nos nós por conta própria)."""
+        v = self._version = next(_carimbos)
+        return v
+
+    def _touch(self, node: '_Node') -> None:
+        """Registra que o elemento de node mudou: nova versão da árvore e,
+        com subtree_versions, dos ancestrais (tamanho e altura não mudam)."""
+        v = self._nova_versao()
+        if self._subtree_versions:
+            while node is not None:
+                node.version = v
+                node = node.parent
+
+    def _exige_completa(self) -> None:
+        if self._compact:
+            raise ValueError("árvore compacta não guarda pai, altura nem tamanho dos nós")
+
+    # ---------------- informações básicas ----------------
+    def __len__(self) -> int:
+        return self._size
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def root(self) -> Optional['Position']:
+        return self._make_position(self._root)
+
+    def parent(self, p: 'Position') -> Optional['Position']:
+        self._exige_completa()
+        node = self._validate(p)
+        return self._make_position(node.parent)
+
+    def left(self, p: 'Position') -> Optional['Position']:
+        node = self._validate(p)
+        return self._make_position(node.left)
+
+    def right(self, p: 'Position') -> Optional['Position']:
+        node = self._validate(p)
+        return self._make_position(node.right)
+
+    def sibling(self, p: 'Position') -> Optional['Position']:
+        self._exige_completa()
+        node = self._validate(p)
+        parent = node.parent
+        if parent is None:
+            return None
+        if parent.left is node:
+            return self._make_position(parent.right)
+        else:
+            return self._make_position(parent.left)
+
+    def num_children(self, p: 'Position') -> int:
+        node = self._validate(p)
+        cnt = 0
+        if node.left is not None:
+            cnt += 1
+        if node.right is not None:
+            cnt += 1
+        return cnt
+
+    def children(self, p: 'Position') -> Iterator['Position']:
+        node = self._validate(p)
+        if node.left is not None:
+            yield self._make_position(node.left)
+        if node.right is not None:
+            yield self._make_position(node.right)
+
+    def is_root(self, p: 'Position') -> bool:
+        return self._validate(p) is self._root
+
+    def is_leaf(self, p: 'Position') -> bool:
+        node = self._validate(p)
+        return node.left is None and node.right is None
+
+    # ---------------- estatísticas por nó ----------------
+    def height(self, p: Optional['Position'] = None) -> int:
+        """Altura da subárvore de p (ou da árvore toda). O(1)."""
+        self._exige_completa()
+        if p is None:
+            if self._root is None:
+                raise ValueError("árvore vazia não tem altura")
+            return self._root.height
+        return self._validate(p).height
+
+    def depth(self, p: 'Position') -> int:
+        """Profundidade de p (raiz tem profundidade 0). O(profundidade)."""
+        self._exige_completa()
+        node = self._validate(p)
+        d = 0
+        while node.parent is not None:
+            node = node.parent
+            d += 1
+        return d
+
+    def subtree_size(self, p: 'Position') -> int:
+        """Número de nós na subárvore de p. O(1)."""
+        self._exige_completa()
+        return self._validate(p).size
+
+    def version(self, p: Optional['Position'] = None) -> int:
+        """Versão da árvore (ou da subárvore de p). O(1).
+
+        Muda sempre que algo dentro dela muda por add_*, replace, delete,
+        attach ou detach; igual significa que nada mudou (mudanças feitas
+        dentro de um elemento mutável não contam). A versão de uma
+        subárvore só existe em árvores criadas com subtree_versions=True.
+        """
+        if p is None:
+            return self._version
+        if not self._subtree_versions:
+            raise ValueError("version(p) precisa de LinkedBinaryTree(subtree_versions=True)")
+        return self._validate(p).version
+
+    # ---------------- modificadores (update) ----------------
+    def add_root(self, e: Any) -> 'Position':
+        """Adiciona raiz se árvore estiver vazia, retorna a posição da raiz."""
+        if self._root is not None:
+            raise ValueError("raiz já existe")
+        self._root = self._new_node(e)
+        self._size = 1
+        self._shape += 1
+        self._fix_upward(self._root, 0)
+        # posição da raiz
+        return self._make_position(self._root)  # type: ignore
+
+    def add_left(self, p: 'Position', e: Any) -> 'Position':
+        node = self._validate(p)
+        if node.left is not None:
+            raise ValueError("já existe filho esquerdo")
+        node.left = self._new_node(e, node)
+        self._size += 1
+        self._fix_upward(node, 1)
+        return self._make_position(node.left)  # type: ignore
+
+    def add_right(self, p: 'Position', e: Any) -> 'Position':
+        node = self._validate(p)
+        if node.right is not None:
+            raise ValueError("já existe filho direito")
+        node.right = self._new_node(e, node)
+        self._size += 1
+        self._fix_upward(node, 1)
+        return self._make_position(node.right)  # type: ignore
+
+    def replace(self, p: 'Position', e: Any) -> Any:
+        """Substitui o elemento em p por e; retorna o elemento antigo.
+
+        O(1); O(profundidade de p) com subtree_versions=True.
+        """
+        node = self._validate(p)
+        old = node.element
+        node.element = e
+        self._touch(node)
+        return old
+
+    def delete(self, p: 'Position') -> Any:
+        """Remove o nó p que tem no máximo 1 filho.
+        Retorna o elemento do nó removido.
+        Após remoção, a posição p fica inválida (marcada).
+        """
+        self._exige_completa()
+        node = self._validate(p)
+        if self.num_children(p) == 2:
+            raise ValueError("não pode remover nó com dois filhos")
+        # filho único ou nenhum
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        if child is not None:
+            child.parent = parent
+        if node is self._root:
+            self._root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        self._fix_upward(parent, -1)
+        self._size -= 1
+        # desativa node
+        node.parent = node  # convenção: parent aponta para si mesmo significa inválido
+        element = node.element
+        self._release(node)
+        return element
+
+    def attach(self, p: 'Position', t1: 'LinkedBinaryTree', t2: 'LinkedBinaryTree') -> None:
+        """Anexa duas árvores t1 e t2 como subárvores esquerda/direita de p (que deve ser folha).
+        Depois da operação, t1 e t2 ficam vazias (seus nós são transferidos para self).
+        """
+        for t in (self, t1, t2):
+            t._exige_completa()
+        node = self._validate(p)
+        if self.num_children(p) > 0:
+            raise ValueError("p deve ser folha para attach")
+        # anexar t1 como left
+        if not t1.is_empty():
+            t1_root = t1._root
+            node.left = t1_root
+            t1_root.parent = node
+            self._size += t1._size
+            # esvazia t1
+            t1._root = None
+            t1._size = 0
+        # anexar t2 como right
+        if not t2.is_empty():
+            t2_root = t2._root
+            node.right = t2_root
+            t2_root.parent = node
+            self._size += t2._size
+            t2._root = None
+            t2._size = 0
+        # node era folha (size 1): o que entrou é size dos filhos
+        self._fix_upward(node, (node.left.size if node.left is not None else 0)
+                         + (node.right.size if node.right is not None else 0))
+        # Positions antigas de t1/t2 deixam de valer lá (os nós agora são de self)
+        t1._epoch += 1
+        t2._epoch += 1
+        t1._shape += 1
+        t2._shape += 1
+        t1._version = t2._version = next(_carimbos)
+
+    def detach(self, p: 'Position') -> 'LinkedBinaryTree':
+        """Remove a subárvore com raiz em p e a devolve como uma nova árvore.
+
+        É o inverso de attach: só religa ponteiros. Positions antigas para
+        nós da subárvore ficam inválidas nesta árvore (via época). Os nós
+        continuam na árvore devolvida, então não passam pelo pool.
+        """
+        self._exige_completa()
+        node = self._validate(p)
+        count = self._unlink(node, node.parent)
+        node.parent = None
+        other = LinkedBinaryTree(clear_on_delete=self._clear_on_delete, pool_size=self._pool_size,
+                                 subtree_versions=self._subtree_versions)
+        other._root = node
+        other._size = count
+        other._version = next(_carimbos)
+        return other
+
+    def _unlink(self, node: '_Node', parent: Optional['_Node']) -> int:
+        """Solta a subárvore de node, filho de parent (None: node é a raiz).
+
+        Sem conferência, e serve também para árvore compacta, que não sabe
+        o pai nem o tamanho dos nós. Retorna quantos nós saíram.
+        """
+        if self._compact:
+            count = 0
+            stack = [node]
+            while stack:
+                n = stack.pop()
+                count += 1
+                if n.left is not None:
+                    stack.append(n.left)
+                if n.right is not None:
+                    stack.append(n.right)
+        else:
+            count = node.size
+        if parent is None:
+            self._root = None
+        elif parent.left is node:
+            parent.left = None
+        else:
+            parent.right = None
+        self._fix_upward(parent, -count)
+        self._size -= count
+        self._epoch += 1
+        return count
+
+    def prune(self, p: 'Position') -> int:
+        """Descarta a subárvore com raiz em p. Retorna quantos nós saíram.
+
+        Com clear_on_delete (ou pool), cada nó descartado passa por _release
+        como no delete: uma Position velha não segura a subárvore viva e os
+        nós podem voltar pelo pool. Sem isso é O(1), como detach.
+        """
+        self._exige_completa()
+        node = self._validate(p)
+        count = self._unlink(node, node.parent)
+        if self._clear_on_delete:
+            stack = [node]
+            while stack:
+                n = stack.pop()
+                if n.left is not None:
+                    stack.append(n.left)
+                if n.right is not None:
+                    stack.append(n.right)
+                n.parent = n        # inválido, como no delete
+                self._release(n)
+        else:
+            node.parent = None
+        return count
+
+    # ---------------- caminho rápido (sem conferência) ----------------
+    # Mesmo efeito de add_root/add_left/add_right, mas com nós no lugar de
+    # Positions: nada de _validate, nem de Position nova a cada chamada, nem
+    # de checar se o lado está livre. O nó devolvido serve de pai para as
+    # próximas chamadas; T._make_position(nó) o transforma em Position.
+    #
+    # Entre _begin_bulk() e _finish_bulk() os _add_* só ligam ponteiros:
+    # tamanho, altura e versão ficam para uma passada única no fim, em vez
+    # de uma subida até a raiz por nó (montar uma lista de n nós deixa de
+    # ser O(n²)). Nesse meio-tempo só valem _add_* e a leitura dos
+    # elementos; height, subtree_size, version etc. veem números velhos.
+    def _add_root(self, e: Any) -> '_Node':
+        self._root = self._new_node(e)
+        self._size = 1
+        if not self._bulk:
+            self._shape += 1
+            self._fix_upward(self._root, 0)
+        return self._root
+
+    def _add_left(self, node: '_Node', e: Any) -> '_Node':
+        child = node.left = self._new_node(e, node)
+        self._size += 1
+        if not self._bulk:
+            self._fix_upward(node, 1)
+        return child
+
+    def _add_right(self, node: '_Node', e: Any) -> '_Node':
+        child = node.right = self._new_node(e, node)
+        self._size += 1
+        if not self._bulk:
+            self._fix_upward(node, 1)
+        return child
+
+    def _begin_bulk(self) -> None:
+        self._bulk = True
+
+    def _finish_bulk(self, node: Optional['_Node'] = None) -> None:
+        """Sai do modo em lote e acerta tamanho, altura e versão.
+
+        Recalcula a subárvore de node (ou a árvore toda) numa pós-ordem
+        iterativa e depois só os ancestrais de node: O(tamanho da
+        subárvore + profundidade de node).
+        """
+        self._bulk = False
+        self._shape += 1
+        v = self._nova_versao()
+        start = self._root if node is None else node
+        if self._compact or start is None:
+            return
+        ordem = []
+        stack = [start]
+        while stack:
+            n = stack.pop()
+            ordem.append(n)
+            if n.left is not None:
+                stack.append(n.left)
+            if n.right is not None:
+                stack.append(n.right)
+        # cada pai entrou em ordem antes dos filhos: de trás para a frente,
+        # os filhos já estão prontos quando o pai é recalculado
+        for n in reversed(ordem):
+            self._refresh(n)
+            n.version = v
+        n = start.parent
+        while n is not None:
+            self._refresh(n)
+            n.version = v
+            n = n.parent
+
+    # ---------------- cópia ----------------
+    def clone(self, p: Optional['Position'] = None, shallow_elements: bool = True,
+              memo: Optional[dict] = None) -> 'LinkedBinaryTree':
+        """Copia a estrutura da árvore (ou só da subárvore de p) numa passada iterativa.
+
+        Com shallow_elements=True os elementos são compartilhados; senão cada
+        elemento passa por copy.deepcopy com o memo dado (o de um deepcopy
+        maior, por exemplo) ou com um memo único para a árvore toda.
+        Uma árvore compacta vira outra compacta (só elemento e filhos); as
+        outras saem com as mesmas opções (pool_size, clear_on_delete,
+        subtree_versions), com o pool vazio. Numa subclasse a cópia é da
+        mesma classe, e os campos que o nó dela acrescenta (em __slots__)
+        são copiados junto; o que a subclasse guarda fora dos nós fica por
+        conta dela (ver IntervalTree e Rope).
+        """
+        compact = self._compact
+        other = LinkedBinaryTree(compact=True) if compact else type(self)()
+        if not compact:
+            other._clear_on_delete = self._clear_on_delete
+            other._pool_size = self._pool_size
+            other._subtree_versions = self._subtree_versions
+        if memo is None:
+            memo = {}
+        elif p is None:
+            memo[id(self)] = other      # elementos que apontam de volta para a árvore
+        src = self._root if p is None else self._validate(p)
+        if src is None:
+            return other
+        Node = other._node_cls
+        extras = _campos_extras(Node)
+        count = 0
+
+        def make(s: 'LinkedBinaryTree._Node', parent: Optional['LinkedBinaryTree._Node']) -> 'LinkedBinaryTree._Node':
+            nonlocal count
+            count += 1
+            e = s.element if shallow_elements else copy.deepcopy(s.element, memo)
+            d = Node(e, parent)
+            if not compact:
+                d.height = s.height
+                d.size = s.size
+                for c in extras:
+                    v = getattr(s, c)
+                    setattr(d, c, v if shallow_elements else copy.deepcopy(v, memo))
+            return d
+
+        root = make(src, None)
+        stack = [(src, root)]
+        while stack:
+            s, d = stack.pop()
+            if s.left is not None:
+                d.left = make(s.left, d)
+                stack.append((s.left, d.left))
+            if s.right is not None:
+                d.right = make(s.right, d)
+                stack.append((s.right, d.right))
+        other._root = root
+        other._size = count
+        return other
+
+    def __copy__(self) -> 'LinkedBinaryTree':
+        return self.clone()
+
+    def __deepcopy__(self, memo: dict) -> 'LinkedBinaryTree':
+        # evita a recursão do deepcopy padrão pelos ponteiros dos nós
+        return self.clone(shallow_elements=False, memo=memo)
+
+    # ---------------- traversals / iterators ----------------
+    def _subtree_preorder(self, p: 'Position') -> Iterator['Position']:
+        yield p
+        for c in self.children(p):
+            yield from self._subtree_preorder(c)
+
+    def preorder(self) -> Iterator['Position']:
+        if not self.is_empty():
+            yield from self._subtree_preorder(self.root())  # type: ignore
+
+    def _subtree_postorder(self, p: 'Position') -> Iterator['Position']:
+        for c in self.children(p):
+            yield from self._subtree_postorder(c)
+        yield p
+
+    def postorder(self) -> Iterator['Position']:
+        if not self.is_empty():
+            yield from self._subtree_postorder(self.root())  # type: ignore
+
+    def _subtree_inorder(self, p: 'Position') -> Iterator['Position']:
+        """Inorder específico para árvore binária: left, node, right."""
+        node = self._validate(p)
+        if node.left is not None:
+            yield from self._subtree_inorder(self._make_position(node.left))  # type: ignore
+        yield self._make_position(node)  # type: ignore
+        if node.right is not None:
+            yield from self._subtree_inorder(self._make_position(node.right))  # type: ignore
+
+    def inorder(self) -> Iterator['Position']:
+        if not self.is_empty():
+            yield from self._subtree_inorder(self.root())  # type: ignore
+
+    def breadthfirst(self) -> Iterator['Position']:
+        if not self.is_empty():
+            fringe = deque()
+            fringe.append(self.root())
+            while fringe:
+                p = fringe.popleft()
+                yield p  # type: ignore
+                for c in self.children(p):  # type: ignore
+                    fringe.append(c)
+
+    # ---------------- travessias assíncronas ----------------
+    def _traversal(self, order: str) -> Iterator['Position']:
+        """Mesma ordem de preorder/inorder/postorder/breadthfirst, mas com
+        pilha (ou fila) explícita: não estoura em árvores fundas."""
+        if order not in ("preorder", "inorder", "postorder", "breadthfirst"):
+            raise ValueError(f"travessia desconhecida: {order!r}")
+        if self._root is None:
+            return
+        if order == "breadthfirst":
+            fringe = deque([self._root])
+            while fringe:
+                node = fringe.popleft()
+                yield self._make_position(node)  # type: ignore
+                if node.left is not None:
+                    fringe.append(node.left)
+                if node.right is not None:
+                    fringe.append(node.right)
+            return
+        # (nó, filhos já empilhados?): na 2ª vez o nó sai (inorder/postorder)
+        stack = [(self._root, False)]
+        while stack:
+            node, expandido = stack.pop()
+            if expandido or order == "preorder":
+                yield self._make_position(node)  # type: ignore
+                if expandido:
+                    continue
+            if order == "postorder":
+                stack.append((node, True))
+            if node.right is not None:
+                stack.append((node.right, False))
+            if order == "inorder":
+                stack.append((node, True))
+            if node.left is not None:
+                stack.append((node.left, False))
+
+    async def atraverse(self, order: str = "preorder", every: int = 256) -> AsyncIterator['Position']:
+        """Versão assíncrona de preorder/inorder/postorder/breadthfirst.
+
+        Devolve o controle ao event loop a cada `every` nós. Se a forma da
+        árvore mudar no meio (add_*, delete, attach, detach; replace não
+        conta), levanta RuntimeError em vez de seguir com o iterador num
+        estado errado. Usa pilha explícita, então aguenta árvores fundas.
+        """
+        if every < 1:
+            raise ValueError("every deve ser pelo menos 1")
+        state = self._shape
+        it = self._traversal(order)
+        try:
+            count = 0
+            for p in it:
+                yield p
+                count += 1
+                if count % every == 0:
+                    await asyncio.sleep(0)
+                if self._shape != state:
+                    raise RuntimeError("árvore modificada durante a travessia")
+        finally:
+            # cancelamento ou break: fecha o gerador síncrono de baixo
+            it.close()
+
+    def apreorder(self, every: int = 256) -> AsyncIterator['Position']:
+        return self.atraverse("preorder", every)
+
+    def ainorder(self, every: int = 256) -> AsyncIterator['Position']:
+        return self.atraverse("inorder", every)
+
+    def apostorder(self, every: int = 256) -> AsyncIterator['Position']:
+        return self.atraverse("postorder", every)
+
+    def abreadthfirst(self, every: int = 256) -> AsyncIterator['Position']:
+        return self.atraverse("breadthfirst", every)
+
+    async def abuffered(self, order: str = "preorder", maxsize: int = 1024,
+                        every: int = 256) -> AsyncIterator['Position']:
+        """Travessia produzida numa task separada através de uma asyncio.Queue limitada.
+
+        O produtor fica bloqueado em put() quando o consumidor não acompanha
+        (backpressure). Sair do async for (break, exceção ou cancelamento)
+        cancela o produtor. Como em atraverse, mudar a forma da árvore no
+        meio levanta RuntimeError (também para itens que já estavam na fila).
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        state = self._shape
+        done = object()
+
+        async def produce() -> None:
+            async for p in self.atraverse(order, every):
+                await queue.put(p)
+            await queue.put(done)
+
+        task = asyncio.ensure_future(produce())
+        getter = None
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait([getter, task], return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done() and task.done() and task.exception() is not None:
+                    # produtor falhou antes de mandar mais nada: propaga o erro dele
+                    raise task.exception()  # type: ignore
+                item = await getter
+                if item is done:
+                    break
+                yield item
+                if self._shape != state:
+                    raise RuntimeError("árvore modificada durante a travessia")
+        finally:
+            if getter is not None:
+                getter.cancel()
+            task.cancel()
+            # espera o produtor sair; um erro dele já foi repassado acima (ou não importa mais)
+            await asyncio.gather(task, return_exceptions=True)
+
+    def euler_fold(self, *visitors: 'EulerVisitor') -> List[Any]:
+        """Roda vários EulerVisitor juntos numa única Euler tour (iterativa).
+
+        Cada nó ganha uma só Position, compartilhada por todos os visitantes.
+        Retorna [v.result(valor da raiz) for v in visitors].
+        """
+        # só chama os ganchos que cada visitante realmente sobrescreveu
+        pres = [v.pre for v in visitors if type(v).pre is not EulerVisitor.pre]
+        ins = [v.inorder for v in visitors if type(v).inorder is not EulerVisitor.inorder]
+        posts = [v.post for v in visitors]
+        k = len(visitors)
+        vazio = [None] * k
+        root_vals = vazio
+        if self._root is not None:
+            # quadro: [nó, etapa, profundidade, Position, valores esq, valores dir]
+            stack = [[self._root, 0, 0, self._make_position(self._root), vazio, vazio]]
+            while stack:
+                fr = stack[-1]
+                node, stage, depth, p = fr[0], fr[1], fr[2], fr[3]
+                if stage == 0:
+                    for f in pres:
+                        f(p, depth)
+                    fr[1] = 1
+                    if node.left is not None:
+                        stack.append([node.left, 0, depth + 1, self._make_position(node.left), vazio, vazio])
+                        continue
+                    stage = 1
+                if stage == 1:
+                    for f in ins:
+                        f(p, depth)
+                    fr[1] = 2
+                    if node.right is not None:
+                        stack.append([node.right, 0, depth + 1, self._make_position(node.right), vazio, vazio])
+                        continue
+                vals = [post(p, depth, fr[4][i], fr[5][i]) for i, post in enumerate(posts)]
+                stack.pop()
+                if stack:
+                    # etapa 1 no pai: voltou da esquerda; etapa 2: da direita
+                    stack[-1][4 if stack[-1][1] == 1 else 5] = vals
+                else:
+                    root_vals = vals
+        return [v.result(val) for v, val in zip(visitors, root_vals)] if k else []
+
+    # ---------------- utilitários de representação ----------------
+    def __iter__(self) -> Iterator[Any]:
+        """Itera sobre elementos em inorder (útil para debugging)."""
+        for p in self.inorder():
+            yield p.element()  # type: ignore
+
+    def positions(self) -> Iterator['Position']:
+        """Todas as Positions, em preorder."""
+        return self.preorder()
+
+    def memory_usage(self) -> dict:
+        """Bytes usados pela árvore, separados em nós, Positions e elementos."""
+        return uso_de_memoria(self._root, "element", "left", "right",
+                              self._node_cls(None), LinkedBinaryTree.Position(self, None))  # type: ignore
+
+    def __str__(self) -> str:
+        if self.is_empty():
+            return "LinkedBinaryTree()"
+        return "LinkedBinaryTree(inorder: [" + ", ".join(repr(e) for e in self) + "])"
+
+# ---------------- visitantes para euler_fold ----------------
+class EulerVisitor:
+    """Base para os cálculos feitos por LinkedBinaryTree.euler_fold.
+
+    Os ganchos recebem a Position do nó e a profundidade dele. post recebe
+    também o valor que o próprio visitante devolveu para a subárvore esquerda
+    e para a direita (None se o filho não existe); o que post retorna vira o
+    valor desta subárvore. result transforma o valor da raiz na resposta.
+    """
+
+    def pre(self, p: LinkedBinaryTree.Position, depth: int) -> None:
+        pass
+
+    def inorder(self, p: LinkedBinaryTree.Position, depth: int) -> None:
+        pass
+
+    def post(self, p: LinkedBinaryTree.Position, depth: int, left: Any, right: Any) -> Any:
+        return None
+
+    def result(self, value: Any) -> Any:
+        return value
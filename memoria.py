@@ -0,0 +1,183 @@
+"""Contabilidade de memória da LinkedBinaryTree (linkedBinaryTree.py).
+
+`uso_de_memoria` percorre os nós (sem recursão) e separa os bytes em
+nós, Positions e elementos. `medir_bytes_por_milhao` usa tracemalloc para
+medir o custo real de montar uma árvore e `conferir_orcamento` levanta
+RuntimeError quando ele passa de `ORCAMENTO_POR_MILHAO`.
+"""
+
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+
+# orçamento (bytes por milhão de nós) medido no CPython 3.11 com uma folga
+# de ~10%; só conta a estrutura (os elementos são todos None)
+ORCAMENTO_POR_MILHAO: Dict[str, int] = {
+    "LinkedBinaryTree": 112_000_000,
+    "LinkedBinaryTree (compact)": 63_000_000,
+}
+
+
+def tem_slots(cls: type) -> bool:
+    """True se as instâncias de cls não carregam __dict__."""
+    return cls.__dictoffset__ == 0
+
+
+def custo_instancia(obj: Any) -> int:
+    """Bytes de um objeto sozinho (mais o __dict__, se a classe não tiver slots).
+
+    Deve ser chamado num objeto descartável: ler o __dict__ obriga o
+    CPython a materializá-lo.
+    """
+    tam = sys.getsizeof(obj)
+    if not tem_slots(type(obj)):
+        tam += sys.getsizeof(obj.__dict__)
+    return tam
+
+
+def tamanho_profundo(obj: Any, vistos: Optional[set] = None) -> int:
+    """Tamanho de obj e de tudo o que ele alcança (cada objeto conta uma vez)."""
+    if vistos is None:
+        vistos = set()
+    total = 0
+    pilha = [obj]
+    while pilha:
+        o = pilha.pop()
+        if id(o) in vistos:
+            continue
+        vistos.add(id(o))
+        total += sys.getsizeof(o)
+        if isinstance(o, (str, bytes, bytearray, int, float, complex, bool, type(None))):
+            continue
+        if isinstance(o, dict):
+            pilha.extend(o.keys())
+            pilha.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            pilha.extend(o)
+        if hasattr(o, "__dict__") and not isinstance(o, type):
+            pilha.append(o.__dict__)
+        for nome in getattr(type(o), "__slots__", ()):
+            if hasattr(o, nome):
+                pilha.append(getattr(o, nome))
+    return total
+
+
+def uso_de_memoria(raiz: Any, campo_elem: str, campo_esq: str, campo_dir: str,
+                   no_exemplo: Any, posicao_exemplo: Any = None) -> Dict[str, Any]:
+    """Relatório de memória de uma árvore a partir do nó raiz.
+
+    - nodes: bytes dos nós (custo de um nó vazio vezes a quantidade)
+    - positions: bytes que uma travessia completa aloca em Positions
+      (uma por nó); 0 se a árvore não usa Position
+    - elements: tamanho profundo dos elementos (objetos compartilhados
+      contam uma vez só)
+    - warnings: classes sem __slots__ encontradas
+    """
+    n = 0
+    vistos: set = set()
+    bytes_elem = 0
+    pilha = [raiz] if raiz is not None else []
+    while pilha:
+        no = pilha.pop()
+        n += 1
+        bytes_elem += tamanho_profundo(getattr(no, campo_elem), vistos)
+        esq = getattr(no, campo_esq)
+        dir_ = getattr(no, campo_dir)
+        if dir_ is not None:
+            pilha.append(dir_)
+        if esq is not None:
+            pilha.append(esq)
+
+    avisos: List[str] = []
+    por_no = custo_instancia(no_exemplo)
+    if not tem_slots(type(no_exemplo)):
+        avisos.append(f"{type(no_exemplo).__qualname__} sem __slots__ (cada nó carrega um __dict__)")
+    por_posicao = 0
+    if posicao_exemplo is not None:
+        por_posicao = custo_instancia(posicao_exemplo)
+        if not tem_slots(type(posicao_exemplo)):
+            avisos.append(f"{type(posicao_exemplo).__qualname__} sem __slots__ "
+                          "(cada Position criada numa travessia carrega um __dict__)")
+
+    return {
+        "size": n,
+        "nodes": n * por_no,
+        "positions": n * por_posicao,
+        "elements": bytes_elem,
+        "total": n * por_no + n * por_posicao + bytes_elem,
+        "per_node": por_no,
+        "per_position": por_posicao,
+        "warnings": avisos,
+    }
+
+
+def montar_completa(arvore: Any, n: int, elemento: Optional[Callable[[int], Any]] = None) -> Any:
+    """Monta uma árvore completa de n nós (por nível) usando add_root/add_left/add_right.
+
+    Usa a API de Position (qualquer árvore com add_root/add_left/add_right).
+    O i-ésimo nó recebe elemento(i) (por padrão o próprio i).
+    """
+    if elemento is None:
+        elemento = int
+    if n <= 0:
+        return arvore
+    fila = [arvore.add_root(elemento(0))]
+    i = 1
+    k = 0
+    while i < n:
+        pai = fila[k]
+        k += 1
+        fila.append(arvore.add_left(pai, elemento(i)))
+        i += 1
+        if i < n:
+            fila.append(arvore.add_right(pai, elemento(i)))
+            i += 1
+    return arvore
+
+
+def medir_bytes_por_milhao(fabrica: Callable[[], Any], n: int = 100_000) -> int:
+    """Mede com tracemalloc os bytes que sobram depois de montar n nós.
+
+    As Positions devolvidas durante a montagem são descartadas antes da
+    medição final, então só conta o que a árvore realmente retém.
+    """
+    tracemalloc.start()
+    try:
+        antes, _ = tracemalloc.get_traced_memory()
+        arvore = fabrica()
+        montar_completa(arvore, n, lambda i: None)
+        depois, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del arvore
+    return (depois - antes) * 1_000_000 // n
+
+
+def conferir_orcamento(nome: str, fabrica: Callable[[], Any], n: int = 100_000) -> int:
+    """medir_bytes_por_milhao contra ORCAMENTO_POR_MILHAO[nome]; RuntimeError se passar."""
+    medido = medir_bytes_por_milhao(fabrica, n)
+    limite = ORCAMENTO_POR_MILHAO[nome]
+    if medido > limite:
+        raise RuntimeError(f"{nome}: {medido / 1e6:.1f} MB por milhão de nós, "
+                           f"acima do orçamento de {limite / 1e6:.0f} MB")
+    return medido
+
+
+if __name__ == "__main__":
+    from linkedBinaryTree import LinkedBinaryTree
+
+    fabricas = {
+        "LinkedBinaryTree": LinkedBinaryTree,
+        "LinkedBinaryTree (compact)": lambda: LinkedBinaryTree(compact=True),
+    }
+
+    print("Bytes por milhão de nós (tracemalloc):")
+    for nome, fabrica in fabricas.items():
+        medido = conferir_orcamento(nome, fabrica)      # levanta se passar
+        print(f"  {nome:28s} {medido / 1e6:7.1f} MB  (orçamento {ORCAMENTO_POR_MILHAO[nome] / 1e6:.0f} MB) ok")
+
+    print("\nRelatório de uma árvore pequena:")
+    t = montar_completa(LinkedBinaryTree(), 7)
+    for chave, valor in t.memory_usage().items():
+        print(f"  {chave}: {valor}")